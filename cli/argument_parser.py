@@ -6,6 +6,36 @@ import argparse
 from config import Config
 
 
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that defers adding a subcommand's arguments
+    until that subcommand is actually selected on the command line.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._builders = {}
+
+    def add_lazy_parser(self, name, builder, **kwargs):
+        """
+        Add a subcommand whose arguments are added by builder(subparser) on first use.
+
+        Args:
+            name: Subcommand name
+            builder: Callable that adds arguments to the subparser
+            **kwargs: Passed through to add_parser
+        """
+        subparser = self.add_parser(name, **kwargs)
+        self._builders[name] = builder
+        return subparser
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        builder = self._builders.pop(values[0], None)
+        if builder is not None:
+            builder(self._name_parser_map[values[0]])
+        super().__call__(parser, namespace, values, option_string)
+
+
 class CLIArgumentParser:
     """
     Creates and manages command-line argument parser.
@@ -32,10 +62,37 @@ class CLIArgumentParser:
         # Custom context option
         parser.add_argument('--custom-context', type=str, help='Custom context JSON string or file path')
 
+        # Subcommand arguments are only added once that subcommand is parsed
+        parser.register('action', 'parsers', _LazySubParsersAction)
         subparsers = parser.add_subparsers(dest='command', help='Commands')
 
-        # Start command
-        start_parser = subparsers.add_parser('start', help='Start a new workflow')
+        subparsers.add_lazy_parser('start', CLIArgumentParser._add_start_arguments,
+                                   help='Start a new workflow')
+        subparsers.add_parser('status', help='Show workflow status')
+        subparsers.add_lazy_parser('show', CLIArgumentParser._add_show_arguments,
+                                   help='Show notebook')
+        subparsers.add_parser('list', help='List notebooks')
+        subparsers.add_lazy_parser('export', CLIArgumentParser._add_export_arguments,
+                                   help='Export notebook to markdown')
+        subparsers.add_parser('repl', help='Start interactive REPL')
+        subparsers.add_lazy_parser('send-api', CLIArgumentParser._add_send_api_arguments,
+                                   help='Send API request from state file')
+        subparsers.add_lazy_parser('resume', CLIArgumentParser._add_resume_arguments,
+                                   help='Resume workflow from state file')
+        subparsers.add_lazy_parser('test-request', CLIArgumentParser._add_test_request_arguments,
+                                   help='Preview API request without sending')
+        subparsers.add_lazy_parser('apply-transition', CLIArgumentParser._add_apply_transition_arguments,
+                                   help='Apply transition to state and export updated state')
+        subparsers.add_lazy_parser('test-actions', CLIArgumentParser._add_test_actions_arguments,
+                                   help='Execute actions from JSON file with rich streaming display')
+        subparsers.add_lazy_parser('export-markdown', CLIArgumentParser._add_export_markdown_arguments,
+                                   help='Export notebook from state file to markdown')
+
+        return parser
+
+    @staticmethod
+    def _add_start_arguments(start_parser: argparse.ArgumentParser):
+        """Add arguments for the start command."""
         start_parser.add_argument('--problem', type=str, help='Problem description')
         start_parser.add_argument('--context', type=str, help='Additional context for workflow initialization')
         start_parser.add_argument('--config', type=str, help='Path to config JSON file (e.g., housing_config.json)')
@@ -44,26 +101,20 @@ class CLIArgumentParser:
         start_parser.add_argument('--iterate', action='store_true', help='Enable automatic iteration (loop through states)')
         start_parser.add_argument('--max-iterations', type=int, default=10, help='Maximum iterations in loop mode (default: 10)')
 
-        # Status command
-        subparsers.add_parser('status', help='Show workflow status')
-
-        # Show command
-        show_parser = subparsers.add_parser('show', help='Show notebook')
+    @staticmethod
+    def _add_show_arguments(show_parser: argparse.ArgumentParser):
+        """Add arguments for the show command."""
         show_parser.add_argument('--notebook', type=str, help='Notebook filename')
 
-        # List command
-        subparsers.add_parser('list', help='List notebooks')
-
-        # Export command
-        export_parser = subparsers.add_parser('export', help='Export notebook to markdown')
+    @staticmethod
+    def _add_export_arguments(export_parser: argparse.ArgumentParser):
+        """Add arguments for the export command."""
         export_parser.add_argument('notebook', type=str, help='Notebook filename')
         export_parser.add_argument('--output', type=str, help='Output filename')
 
-        # REPL command
-        subparsers.add_parser('repl', help='Start interactive REPL')
-
-        # Send-API command
-        send_api_parser = subparsers.add_parser('send-api', help='Send API request from state file')
+    @staticmethod
+    def _add_send_api_arguments(send_api_parser: argparse.ArgumentParser):
+        """Add arguments for the send-api command."""
         send_api_parser.add_argument('--state-file', type=str, required=True, help='Path to state JSON file')
         send_api_parser.add_argument('--api-type', type=str, required=False,
                                      choices=['planning', 'generating', 'reflecting'],
@@ -71,14 +122,16 @@ class CLIArgumentParser:
         send_api_parser.add_argument('--output', type=str, help='Output file for response (optional)')
         send_api_parser.add_argument('--stream', action='store_true', help='Use streaming for generating API')
 
-        # Resume command
-        resume_parser = subparsers.add_parser('resume', help='Resume workflow from state file')
+    @staticmethod
+    def _add_resume_arguments(resume_parser: argparse.ArgumentParser):
+        """Add arguments for the resume command."""
         resume_parser.add_argument('--state-file', type=str, required=True, help='Path to state JSON file')
         resume_parser.add_argument('--continue', dest='continue_execution', action='store_true',
                                   help='Continue execution after loading state')
 
-        # Test-request command
-        test_req_parser = subparsers.add_parser('test-request', help='Preview API request without sending')
+    @staticmethod
+    def _add_test_request_arguments(test_req_parser: argparse.ArgumentParser):
+        """Add arguments for the test-request command."""
         test_req_parser.add_argument('--state-file', type=str, required=True, help='Path to state JSON file')
         test_req_parser.add_argument('--api-type', type=str, required=False,
                                      choices=['planning', 'generating', 'reflecting'],
@@ -87,9 +140,9 @@ class CLIArgumentParser:
         test_req_parser.add_argument('--format', type=str, choices=['json', 'pretty'], default='pretty',
                                      help='Output format (json or pretty)')
 
-        # Apply-transition command
-        apply_trans_parser = subparsers.add_parser('apply-transition',
-                                                   help='Apply transition to state and export updated state')
+    @staticmethod
+    def _add_apply_transition_arguments(apply_trans_parser: argparse.ArgumentParser):
+        """Add arguments for the apply-transition command."""
         apply_trans_parser.add_argument('--state-file', type=str, required=True,
                                        help='Path to input state JSON file')
         apply_trans_parser.add_argument('--transition-file', type=str, required=True,
@@ -99,9 +152,9 @@ class CLIArgumentParser:
         apply_trans_parser.add_argument('--format', type=str, choices=['json', 'pretty'], default='pretty',
                                        help='Output format (json or pretty)')
 
-        # Test-actions command
-        test_actions_parser = subparsers.add_parser('test-actions',
-                                                    help='Execute actions from JSON file with rich streaming display')
+    @staticmethod
+    def _add_test_actions_arguments(test_actions_parser: argparse.ArgumentParser):
+        """Add arguments for the test-actions command."""
         test_actions_parser.add_argument('--actions-file', type=str, required=True,
                                         help='Path to actions JSON file')
         test_actions_parser.add_argument('--state-file', type=str, required=True,
@@ -113,12 +166,10 @@ class CLIArgumentParser:
         test_actions_parser.add_argument('--delay', type=float, default=0.3,
                                         help='Delay between actions in seconds (default: 0.3)')
 
-        # Export-markdown command
-        export_md_parser = subparsers.add_parser('export-markdown',
-                                                help='Export notebook from state file to markdown')
+    @staticmethod
+    def _add_export_markdown_arguments(export_md_parser: argparse.ArgumentParser):
+        """Add arguments for the export-markdown command."""
         export_md_parser.add_argument('--state-file', type=str, required=True,
                                      help='Path to state JSON file')
         export_md_parser.add_argument('--output', type=str, required=False,
                                      help='Output markdown file path (default: stdout)')
-
-        return parser
@@ -4,10 +4,12 @@ Base classes for CLI commands.
 
 from .base_command import BaseCommand
 from .cli_helpers import CLIHelpers
+from .command_group import CommandGroup
 from .dummy_context import DummyContext
 
 __all__ = [
     'BaseCommand',
     'CLIHelpers',
+    'CommandGroup',
     'DummyContext',
 ]
@@ -47,7 +47,7 @@ class CLIHelpers:
             notebook_data = state_data['notebook']
 
             # Clear existing cells
-            self.notebook_store.cells.clear()
+            self.notebook_store.clear_cells()
 
             # Load cells from state
             last_code_cell_id = None
@@ -0,0 +1,24 @@
+"""
+Base class for command groups owned by WorkflowCLI.
+"""
+
+
+class CommandGroup:
+    """
+    A group of related commands bound to a WorkflowCLI instance.
+
+    Attribute reads the group does not define, and all attribute writes,
+    are forwarded to the owning CLI, so command methods keep using
+    self.notebook_store, self.info(), self._load_state_file(), etc.
+    """
+
+    def __init__(self, cli):
+        object.__setattr__(self, '_cli', cli)
+
+    def __getattr__(self, name):
+        if name == '_cli':
+            raise AttributeError(name)
+        return getattr(self._cli, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cli, name, value)
@@ -6,12 +6,13 @@ This file maintains backward compatibility by re-exporting the main classes.
 New modular structure:
 - cli/base/ - Base classes (BaseCommand, CLIHelpers, DummyContext)
 - cli/commands/ - Command modules (StartCommand, StateCommands, NotebookCommands, APICommands, BasicCommands)
-- cli/workflow_cli.py - Main WorkflowCLI class combining all functionality
+- cli/workflow_cli.py - Main WorkflowCLI class composing all functionality
 
-Import hierarchy:
+Composition:
     WorkflowCLI inherits from:
     ├── BaseCommand (core initialization, stores, logging)
-    ├── CLIHelpers (helper methods for state/action handling)
+    └── CLIHelpers (helper methods for state/action handling)
+    and binds command groups on first use:
     ├── StartCommand (start command and iteration loop)
     ├── StateCommands (resume, test-request, apply-transition)
     ├── NotebookCommands (show, list, export, export-markdown)
@@ -1,12 +1,19 @@
 """
 Command modules for CLI operations.
+
+Command groups are imported on first access so that loading one group
+does not pull in the dependencies of all the others.
 """
 
-from .start_command import StartCommand
-from .state_commands import StateCommands
-from .notebook_commands import NotebookCommands
-from .api_commands import APICommands
-from .basic_commands import BasicCommands
+from importlib import import_module
+
+_GROUP_MODULES = {
+    'StartCommand': '.start_command',
+    'StateCommands': '.state_commands',
+    'NotebookCommands': '.notebook_commands',
+    'APICommands': '.api_commands',
+    'BasicCommands': '.basic_commands',
+}
 
 __all__ = [
     'StartCommand',
@@ -15,3 +22,10 @@ __all__ = [
     'APICommands',
     'BasicCommands',
 ]
+
+
+def __getattr__(name):
+    module_name = _GROUP_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
@@ -21,9 +21,10 @@ from core.api_handlers import (
     GeneratingAPIHandler,
     ReflectingAPIHandler
 )
+from cli.base.command_group import CommandGroup
 
 
-class APICommands:
+class APICommands(CommandGroup):
     """
     Handles API-related commands: send-api, test-actions.
     """
@@ -103,15 +104,15 @@ class APICommands:
 
             elif api_type == 'generating':
                 # Generating API via handler
-                actions = []
                 with api_display.display_sending_progress('generating') or DummyContext():
-                    async for action in generating_handler.call(
-                        state_data=state,
-                        stage_id=stage_id,
-                        step_id=step_id,
-                        stream=args.stream
-                    ):
-                        actions.append(action)
+                    actions = [
+                        action async for action in generating_handler.call(
+                            state_data=state,
+                            stage_id=stage_id,
+                            step_id=step_id,
+                            stream=args.stream
+                        )
+                    ]
 
                 # Display actions
                 api_display.display_actions(actions)
@@ -155,15 +156,15 @@ class APICommands:
                 print(f"[DEBUG] Final transition_name: {transition_name}")
 
                 # Collect actions from reflecting API
-                actions = []
                 with api_display.display_sending_progress('reflecting') or DummyContext():
-                    async for action in reflecting_handler.call(
-                        state_data=state,
-                        stage_id=stage_id,
-                        step_id=step_id,
-                        stream=True
-                    ):
-                        actions.append(action)
+                    actions = [
+                        action async for action in reflecting_handler.call(
+                            state_data=state,
+                            stage_id=stage_id,
+                            step_id=step_id,
+                            stream=True
+                        )
+                    ]
 
                 result = {'actions': actions, 'count': len(actions)}
                 api_display.display_api_response('reflecting', result, success=True)
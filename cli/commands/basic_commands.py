@@ -2,8 +2,10 @@
 Basic commands - handles status and REPL.
 """
 
+from cli.base.command_group import CommandGroup
 
-class BasicCommands:
+
+class BasicCommands(CommandGroup):
     """
     Handles basic commands: status, repl.
     """
@@ -49,5 +51,5 @@ class BasicCommands:
     def cmd_repl(self, _args=None):
         """Start interactive REPL."""
         from cli.repl import WorkflowREPL
-        repl = WorkflowREPL(self)
+        repl = WorkflowREPL(self._cli)
         repl.run()
@@ -2,8 +2,10 @@
 Notebook commands - handles notebook-related operations.
 """
 
+from cli.base.command_group import CommandGroup
 
-class NotebookCommands:
+
+class NotebookCommands(CommandGroup):
     """
     Handles notebook-related commands: show, list, export, export-markdown.
     """
@@ -19,9 +19,10 @@ from utils.api_client import workflow_api_client
 from utils.transition_logger import get_transition_logger
 from notebook.observation_to_todo import format_global_task_plan, format_local_task_plan
 from notebook.markdown_renderer import MarkdownRenderer
+from cli.base.command_group import CommandGroup
 
 
-class StartCommand:
+class StartCommand(CommandGroup):
     """
     Handles 'start' command and iteration loop.
     """
@@ -6,9 +6,10 @@ import json
 from utils.state_file_loader import state_file_loader
 from utils.state_updater import state_updater
 from utils.api_display import api_display
+from cli.base.command_group import CommandGroup
 
 
-class StateCommands:
+class StateCommands(CommandGroup):
     """
     Handles state management commands: resume, test-request, apply-transition.
     """
@@ -2,17 +2,76 @@
 Interactive REPL for the workflow system.
 """
 
+import asyncio
 import cmd
+import io
+import json
+import re
+import shutil
+import sys
+from argparse import Namespace
 from silantui import ModernLogger
 
+try:
+    import readline
+except ImportError:
+    readline = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class WorkflowREPL(cmd.Cmd):
+
+def _json_dumps(obj, pretty=False):
+    """Serialize obj with the stdlib encoder, in the same layout orjson uses."""
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _orjson_dumps(obj, pretty=False):
     """
-    Interactive REPL for workflow control.
+    Serialize obj to bytes with orjson.
+
+    Returns:
+        Encoded bytes, or None when orjson is not installed or cannot
+        encode obj (e.g. ints wider than 64 bits)
     """
+    if not ORJSON_AVAILABLE:
+        return None
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    try:
+        return orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _dumps(obj, pretty=False):
+    """Serialize obj to a JSON string, using orjson when it is installed."""
+    data = _orjson_dumps(obj, pretty)
+    if data is None:
+        return _json_dumps(obj, pretty)
+    return data.decode('utf-8')
 
-    intro = """
+
+def _dump_to_file(obj, path, pretty=False):
+    """
+    Write obj as JSON to path.
+
+    Returns:
+        Number of bytes written
+    """
+    data = _orjson_dumps(obj, pretty)
+    if data is None:
+        data = _json_dumps(obj, pretty).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+_INTRO = """
 ╔═══════════════════════════════════════════════════════════╗
 ║         Notebook-BCC Interactive Workflow REPL            ║
 ║                                                           ║
@@ -20,6 +79,166 @@ class WorkflowREPL(cmd.Cmd):
 ║  Type 'quit' or 'exit' to exit                           ║
 ╚═══════════════════════════════════════════════════════════╝
 """
+
+_HELP_TEXT = """
+📚 Available Commands:
+
+Workflow:
+  status          - Show workflow status
+  start [desc]    - Start new workflow
+  show [file]     - Show notebook content
+  list            - List all notebooks
+  export          - Export to markdown
+
+State Machine:
+  transition      - Trigger state transition
+  reset           - Reset state machine
+
+State Management: (NEW)
+  load_state <file>              - Load state from JSON file
+  send_api [type] [opts]         - Send API (auto-inferred or specify type)
+  test_request [type] [opts]     - Preview API request (auto-inferred or specify type)
+  apply_transition <xml> [opts]  - Apply transition XML to loaded state
+
+Context:
+  var             - Variable operations
+  todo            - TODO list operations
+  effect          - Show effect history
+
+Code Execution:
+  exec            - Execute Python code
+  namespace       - Show namespace variables
+
+Notebook:
+  save [file]     - Save current notebook
+  cells           - Show cell statistics
+
+System:
+  clear           - Clear screen
+  help            - Show this help
+  quit/exit       - Exit REPL
+
+"""
+
+_TOKEN_RE = re.compile(r"[^'\s]+|'[^']*'").findall
+
+
+def _parse_args(arg, value_flags=()):
+    """
+    Split a command argument string into positional tokens and flags.
+
+    Single-quoted tokens keep their spaces. Flags named in value_flags
+    consume the following token as their value; other flags become True.
+
+    Returns:
+        Tuple of (positional, flags)
+    """
+    positional = []
+    flags = {}
+    tokens = iter([t[1:-1] if t[0] == "'" else t for t in _TOKEN_RE(arg or '')])
+    for token in tokens:
+        if token.startswith('--'):
+            name = token[2:]
+            if name in value_flags:
+                value = next(tokens, None)
+                if value is not None:
+                    flags[name] = value
+            else:
+                flags[name] = True
+        else:
+            positional.append(token)
+    return positional, flags
+
+# api_type -> (streams actions, stream option or None for --stream, show action list)
+_API_DISPATCH = {
+    'planning': (False, None, False),
+    'generating': (True, None, True),
+    'reflecting': (True, True, False),
+}
+
+# (label, path in state JSON, placeholder) for the apply_transition change summary
+_DIFF_FIELDS = (
+    ('FSM State', ('state', 'FSM', 'state'), 'UNKNOWN'),
+    ('Last Transition', ('state', 'FSM', 'last_transition'), 'None'),
+    ('Stage ID', ('observation', 'location', 'current', 'stage_id'), 'None'),
+    ('Step ID', ('observation', 'location', 'current', 'step_id'), 'None'),
+)
+
+
+def _dig(data, path):
+    """Follow a key path through nested dicts, returning None if any key is missing."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _write_lines(lines):
+    """Write a list of output lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Payloads larger than this are printed without syntax highlighting
+_HIGHLIGHT_MAX_CHARS = 256 * 1024
+
+
+def _write_highlighted_json(text):
+    """
+    Write JSON text to stdout, syntax-highlighted with rich when available.
+
+    The highlighted output is rendered into a buffer and written in one call.
+    """
+    if len(text) > _HIGHLIGHT_MAX_CHARS:
+        _write_lines([text])
+        return
+
+    try:
+        from rich.syntax import Syntax
+        from rich.console import Console
+    except ImportError:
+        _write_lines([text])
+        return
+
+    buf = io.StringIO()
+    console = Console(file=buf, force_terminal=sys.stdout.isatty(), width=shutil.get_terminal_size().columns)
+    console.print(Syntax(text, "json", theme="monokai", line_numbers=True))
+    sys.stdout.write(buf.getvalue())
+
+
+_EMPTY_NS = Namespace()
+
+
+def _cli_forwarder(method_name, doc, arg_field=None, **defaults):
+    """
+    Build a do_* command that forwards to a WorkflowCLI cmd_* method.
+
+    Args:
+        method_name: Name of the WorkflowCLI method to call
+        doc: Docstring for the command (shown by 'help <command>')
+        arg_field: Namespace field that receives the command argument (or None)
+        **defaults: Additional fixed Namespace fields
+
+    Returns:
+        Command method for WorkflowREPL
+    """
+    if arg_field is None:
+        def forward(self, arg):
+            getattr(self.cli, method_name)(_EMPTY_NS)
+    else:
+        def forward(self, arg):
+            getattr(self.cli, method_name)(Namespace(**{arg_field: arg or None}, **defaults))
+
+    forward.__doc__ = doc
+    return forward
+
+
+class WorkflowREPL(cmd.Cmd):
+    """
+    Interactive REPL for workflow control.
+    """
+
+    intro = _INTRO
     prompt = '(workflow) > '
 
     def __init__(self, cli):
@@ -31,39 +250,106 @@ class WorkflowREPL(cmd.Cmd):
         """
         super().__init__()
         self.cli = cli
+        self._loop = None
+        self._effect_lines_cache = {}
+
+        # Commands that ignore their argument, dispatched without parseline
+        self._noarg = {
+            'status': self.do_status,
+            'list': self.do_list,
+            'reset': self.do_reset,
+            'clear': self.do_clear,
+            'quit': self.do_quit,
+            'exit': self.do_exit,
+            'namespace': self.do_namespace,
+            'cells': self.do_cells,
+            'effect': self.do_effect,
+            'q': self.do_quit,
+            'h': self.do_help,
+        }
+
+        # Command names for tab completion, computed once
+        self._commands = tuple(sorted(name[3:] for name in dir(self) if name.startswith('do_')))
+        if readline is not None:
+            readline.set_history_length(1000)
+
+        # Resolve state/API command dependencies once instead of per call
+        try:
+            from config import Config
+            from cli.base.dummy_context import DummyContext
+            from core.api_handlers import (
+                PlanningAPIHandler,
+                GeneratingAPIHandler,
+                ReflectingAPIHandler
+            )
+            from utils.api_client import workflow_api_client
+            from utils.api_display import api_display
+            from utils.state_file_loader import state_file_loader
+            from utils.state_updater import state_updater
+        except ImportError as e:
+            self._deps_error = e
+        else:
+            self._deps_error = None
+            self._DummyContext = DummyContext
+            self._api_client = workflow_api_client
+            self._api_display = api_display
+            self._state_loader = state_file_loader
+            self._state_updater = state_updater
+            self._api_url_map = {
+                'planning': Config.FEEDBACK_API_URL,
+                'generating': Config.BEHAVIOR_API_URL,
+                'reflecting': Config.REFLECTING_API_URL,
+            }
+            self._handlers = {
+                'planning': PlanningAPIHandler(workflow_api_client),
+                'generating': GeneratingAPIHandler(workflow_api_client),
+                'reflecting': ReflectingAPIHandler(workflow_api_client),
+            }
 
-    # ==============================================
-    # Workflow Commands
-    # ==============================================
+    def _get_loop(self):
+        """Get the REPL's event loop, creating it on first use."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
 
-    def do_status(self, arg):
-        """Show current workflow status."""
-        from argparse import Namespace
-        self.cli.cmd_status(Namespace())
+    def _set_loaded_state(self, state_json, parsed_state):
+        """
+        Store the loaded state along with its serialized payload size.
 
-    def do_start(self, arg):
-        """Start a new workflow. Usage: start [problem description]"""
-        from argparse import Namespace
-        self.cli.cmd_start(Namespace(problem=arg or None, notebook_id=None))
+        Args:
+            state_json: Raw state JSON
+            parsed_state: Result of parse_state_for_api for state_json
+        """
+        self._loaded_state = parsed_state
+        self._loaded_state_json = state_json
+        self._loaded_state_size = len(_dumps(parsed_state['state']))
+
+    def _check_deps(self):
+        """Report missing dependencies for state/API commands."""
+        if self._deps_error is not None:
+            print(f"❌ Missing dependency: {self._deps_error}")
+            return False
+        return True
 
-    def do_show(self, arg):
-        """Show notebook content. Usage: show [notebook_filename]"""
-        from argparse import Namespace
-        self.cli.cmd_show(Namespace(notebook=arg or None))
+    # ==============================================
+    # Workflow Commands
+    # ==============================================
 
-    def do_list(self, arg):
-        """List all notebooks."""
-        from argparse import Namespace
-        self.cli.cmd_list(Namespace())
+    do_status = _cli_forwarder('cmd_status', "Show current workflow status.")
+    do_start = _cli_forwarder(
+        'cmd_start', "Start a new workflow. Usage: start [problem description]",
+        'problem', notebook_id=None
+    )
+    do_show = _cli_forwarder('cmd_show', "Show notebook content. Usage: show [notebook_filename]", 'notebook')
+    do_list = _cli_forwarder('cmd_list', "List all notebooks.")
 
     def do_export(self, arg):
         """Export notebook to markdown. Usage: export <notebook_filename> [output_file]"""
-        args = arg.split()
+        args, _ = _parse_args(arg)
         if not args:
             print("Usage: export <notebook_filename> [output_file]")
             return
 
-        from argparse import Namespace
         notebook = args[0]
         output = args[1] if len(args) > 1 else None
         self.cli.cmd_export(Namespace(notebook=notebook, output=output))
@@ -102,22 +388,22 @@ class WorkflowREPL(cmd.Cmd):
 
     def do_var(self, arg):
         """Variable operations. Usage: var [list|set <key> <value>|get <key>]"""
-        args = arg.split()
+        # maxsplit keeps the value verbatim (quotes, '--' words and all)
+        args = arg.split(maxsplit=2)
 
         if not args or args[0] == 'list':
             # List all variables
             context = self.cli.ai_context_store.get_context()
             if context.variables:
-                print("\n📦 Variables:")
-                for key, value in context.variables.items():
-                    print(f"  {key} = {value}")
+                lines = ["\n📦 Variables:"]
+                lines.extend(f"  {key} = {value}" for key, value in context.variables.items())
+                _write_lines(lines)
             else:
                 print("No variables set.")
 
         elif args[0] == 'set' and len(args) >= 3:
             # Set a variable
-            key = args[1]
-            value = ' '.join(args[2:])
+            key, value = args[1], args[2]
             self.cli.ai_context_store.add_variable(key, value)
             print(f"✓ Set {key} = {value}")
 
@@ -141,9 +427,9 @@ class WorkflowREPL(cmd.Cmd):
             # List TODOs
             context = self.cli.ai_context_store.get_context()
             if context.to_do_list:
-                print("\n✅ TODO List:")
-                for i, item in enumerate(context.to_do_list, 1):
-                    print(f"  {i}. {item}")
+                lines = ["\n✅ TODO List:"]
+                lines.extend(f"  {i}. {item}" for i, item in enumerate(context.to_do_list, 1))
+                _write_lines(lines)
             else:
                 print("No pending TODOs.")
 
@@ -165,19 +451,37 @@ class WorkflowREPL(cmd.Cmd):
         """Show effect history."""
         context = self.cli.ai_context_store.get_context()
 
-        print("\n💡 Current Effects:")
-        if context.effect['current']:
-            for i, effect in enumerate(context.effect['current'], 1):
-                print(f"  {i}. {effect[:100]}...")
-        else:
-            print("  None")
+        lines = ["\n💡 Current Effects:"]
+        lines.extend(self._effect_lines('current', context.effect['current']))
+        lines.append("\n📜 Effect History:")
+        lines.extend(self._effect_lines('history', context.effect['history']))
+
+        _write_lines(lines)
+
+    def _effect_lines(self, section, effects):
+        """
+        Get the display lines for an effect list, reusing them while it is unchanged.
+
+        Effect lists only grow, so the list object and its length identify
+        its contents.
+
+        Args:
+            section: Effect section name ('current' or 'history')
+            effects: List of effect strings
+
+        Returns:
+            List of formatted display lines
+        """
+        cached = self._effect_lines_cache.get(section)
+        if cached is not None and cached[0] is effects and cached[1] == len(effects):
+            return cached[2]
 
-        print("\n📜 Effect History:")
-        if context.effect['history']:
-            for i, effect in enumerate(context.effect['history'], 1):
-                print(f"  {i}. {effect[:100]}...")
+        if effects:
+            lines = [f"  {i}. {effect[:100]}..." for i, effect in enumerate(effects, 1)]
         else:
-            print("  None")
+            lines = ["  None"]
+        self._effect_lines_cache[section] = (effects, len(effects), lines)
+        return lines
 
     # ==============================================
     # Code Execution Commands
@@ -205,9 +509,9 @@ class WorkflowREPL(cmd.Cmd):
         variables = self.cli.code_executor.get_all_variables()
 
         if variables:
-            print("\n🐍 Python Namespace:")
-            for name, value in variables.items():
-                print(f"  {name} = {value}")
+            lines = ["\n🐍 Python Namespace:"]
+            lines.extend(f"  {name} = {value}" for name, value in variables.items())
+            _write_lines(lines)
         else:
             print("No user variables in namespace.")
 
@@ -221,15 +525,17 @@ class WorkflowREPL(cmd.Cmd):
             print("Usage: load_state <file_path>")
             return
 
-        import json
-        from utils.state_file_loader import state_file_loader
-        from utils.api_display import api_display
+        if not self._check_deps():
+            return
+
+        state_file_loader = self._state_loader
+        api_display = self._api_display
 
         try:
             # Load state file
             print(f"📂 Loading state from: {arg}")
             state_json = state_file_loader.load_state_file(arg)
-            parsed_state = state_file_loader.parse_state_for_api(state_json)
+            parsed_state = self._state_loader.parse_state_for_api(state_json)
 
             # Display state info
             api_display.display_state_info(parsed_state)
@@ -249,8 +555,7 @@ class WorkflowREPL(cmd.Cmd):
             print(f"   ✓ Effect History: {len(effects.get('history', []))}")
 
             # Store parsed state for send_api command and original JSON for apply_transition
-            self._loaded_state = parsed_state
-            self._loaded_state_json = state_json
+            self._set_loaded_state(state_json, parsed_state)
 
             print("\n✅ State loaded successfully")
             print("   Use 'send_api' to send API requests from this state")
@@ -265,17 +570,11 @@ class WorkflowREPL(cmd.Cmd):
 
     def do_send_api(self, arg):
         """Send API request from loaded state. Usage: send_api [planning|generating|reflecting] [--stream]"""
-        import asyncio
-        from utils.api_client import workflow_api_client
-        from utils.api_display import api_display
-        from utils.state_file_loader import state_file_loader
-        from config import Config
-        from cli.commands import DummyContext
-        from core.api_handlers import (
-            PlanningAPIHandler,
-            GeneratingAPIHandler,
-            ReflectingAPIHandler
-        )
+        if not self._check_deps():
+            return
+
+        api_display = self._api_display
+        DummyContext = self._DummyContext
 
         # Check if state is loaded
         if not hasattr(self, '_loaded_state'):
@@ -283,7 +582,7 @@ class WorkflowREPL(cmd.Cmd):
             return
 
         # Parse arguments
-        args = arg.split() if arg else []
+        args, flags = _parse_args(arg)
 
         # Determine API type (specified or auto-inferred)
         api_type = None
@@ -296,7 +595,7 @@ class WorkflowREPL(cmd.Cmd):
             print(f"\n🤖 Auto-inferred API type: {api_type}")
             print(f"   (You can override with: send_api <planning|generating|reflecting>)")
 
-        use_stream = '--stream' in args
+        use_stream = flags.get('stream', False)
 
         try:
             parsed_state = self._loaded_state
@@ -305,103 +604,45 @@ class WorkflowREPL(cmd.Cmd):
             state = parsed_state['state']
 
             # Determine API URL
-            api_url_map = {
-                'planning': Config.FEEDBACK_API_URL,
-                'generating': Config.BEHAVIOR_API_URL,
-                'reflecting': Config.REFLECTING_API_URL
-            }
-            api_url = api_url_map[api_type]
+            api_url = self._api_url_map[api_type]
 
             # Display request info
-            import json
-            payload_json = json.dumps(state, ensure_ascii=False)
             api_display.display_api_request(
                 api_type=api_type,
                 api_url=api_url,
                 stage_id=stage_id,
                 step_id=step_id,
-                payload_size=len(payload_json)
+                payload_size=self._loaded_state_size
             )
 
-            # Initialize API handlers
-            planning_handler = PlanningAPIHandler(workflow_api_client)
-            generating_handler = GeneratingAPIHandler(workflow_api_client)
-            reflecting_handler = ReflectingAPIHandler(workflow_api_client)
-
             # Send request
+            handler = self._handlers[api_type]
+            streaming, stream, show_actions = _API_DISPATCH[api_type]
+            call_kwargs = {'state_data': state, 'stage_id': stage_id, 'step_id': step_id}
+            if streaming:
+                call_kwargs['stream'] = use_stream if stream is None else stream
+
             async def send_request():
                 try:
-                    if api_type == 'planning':
-                        with api_display.display_sending_progress('planning') or DummyContext():
-                            result = await planning_handler.call(
-                                state_data=state,
-                                stage_id=stage_id,
-                                step_id=step_id
-                            )
-                        api_display.display_api_response('planning', result, success=True)
-                        return result
-
-                    elif api_type == 'generating':
-                        actions = []
-                        with api_display.display_sending_progress('generating') or DummyContext():
-                            async for action in generating_handler.call(
-                                state_data=state,
-                                stage_id=stage_id,
-                                step_id=step_id,
-                                stream=use_stream
-                            ):
-                                actions.append(action)
-
-                        api_display.display_actions(actions)
+                    with api_display.display_sending_progress(api_type) or DummyContext():
+                        if streaming:
+                            actions = [action async for action in handler.call(**call_kwargs)]
+                        else:
+                            result = await handler.call(**call_kwargs)
+
+                    if streaming:
+                        if show_actions:
+                            api_display.display_actions(actions)
                         result = {'actions': actions, 'count': len(actions)}
-                        api_display.display_api_response('generating', result, success=True)
-                        return result
-
-                    elif api_type == 'reflecting':
-                        # 使用 state class 来确定 transition_name
-                        from core.state_classes.state_factory import StateFactory
-
-                        fsm = state.get('state', {}).get('FSM', {})
-                        current_fsm_state = fsm.get('state', '')
-
-                        transition_name = None
-                        state_instance = StateFactory.get_state(current_fsm_state)
-                        if state_instance:
-                            next_transition_event = state_instance.determine_next_transition(state)
-                            if next_transition_event:
-                                transition_name = next_transition_event.value
-
-                        # 如果没有确定 transition_name，使用默认值
-                        if not transition_name:
-                            # 简单的 fallback 逻辑
-                            if 'BEHAVIOR_COMPLETED' in current_fsm_state:
-                                transition_name = 'COMPLETE_STEP'  # 默认假设
-                            elif 'STEP_COMPLETED' in current_fsm_state:
-                                transition_name = 'COMPLETE_STAGE'
-                            else:
-                                transition_name = 'REFLECTING'
-
-                        # Collect actions from reflecting API
-                        actions = []
-                        with api_display.display_sending_progress('reflecting') or DummyContext():
-                            async for action in reflecting_handler.call(
-                                state_data=state,
-                                stage_id=stage_id,
-                                step_id=step_id,
-                                stream=True
-                            ):
-                                actions.append(action)
-
-                        result = {'actions': actions, 'count': len(actions)}
-                        api_display.display_api_response('reflecting', result, success=True)
-                        return result
+                    api_display.display_api_response(api_type, result, success=True)
+                    return result
 
                 except Exception as e:
                     api_display.display_api_response(api_type, {}, success=False, error=str(e))
                     raise
 
             # Run async request
-            result = asyncio.run(send_request())
+            result = self._get_loop().run_until_complete(send_request())
             print("\n✅ API request completed successfully")
 
         except Exception as e:
@@ -409,10 +650,10 @@ class WorkflowREPL(cmd.Cmd):
 
     def do_test_request(self, arg):
         """Preview API request without sending. Usage: test_request [planning|generating|reflecting] [--output <file>] [--format <json|pretty>]"""
-        import json
-        from utils.api_display import api_display
-        from utils.state_file_loader import state_file_loader
-        from config import Config
+        if not self._check_deps():
+            return
+
+        api_display = self._api_display
 
         # Check if state is loaded
         if not hasattr(self, '_loaded_state'):
@@ -420,36 +661,22 @@ class WorkflowREPL(cmd.Cmd):
             return
 
         # Parse arguments
-        args = arg.split() if arg else []
+        args, flags = _parse_args(arg, value_flags=('output', 'format'))
 
         # Determine API type (specified or auto-inferred)
         api_type = None
-        start_idx = 0
         if args and args[0] in ['planning', 'generating', 'reflecting']:
             api_type = args[0]
             print(f"\n🎯 Using specified API type: {api_type}")
-            start_idx = 1
         else:
             # Auto-infer API type from state (NEW: using state machine)
             api_type = self.cli.state_machine.infer_api_type_from_state(self._loaded_state_json)
             print(f"\n🤖 Auto-inferred API type: {api_type}")
             print(f"   (You can override with: test_request <planning|generating|reflecting>)")
-            start_idx = 0
 
         # Parse optional arguments
-        output_file = None
-        output_format = 'pretty'
-
-        i = start_idx
-        while i < len(args):
-            if args[i] == '--output' and i + 1 < len(args):
-                output_file = args[i + 1]
-                i += 2
-            elif args[i] == '--format' and i + 1 < len(args):
-                output_format = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        output_file = flags.get('output')
+        output_format = flags.get('format', 'pretty')
 
         try:
             parsed_state = self._loaded_state
@@ -458,12 +685,7 @@ class WorkflowREPL(cmd.Cmd):
             state = parsed_state['state']
 
             # Determine API URL
-            api_url_map = {
-                'planning': Config.FEEDBACK_API_URL,
-                'generating': Config.BEHAVIOR_API_URL,
-                'reflecting': Config.REFLECTING_API_URL
-            }
-            api_url = api_url_map[api_type]
+            api_url = self._api_url_map[api_type]
 
             # Build payload
             progress_info = state.get('progress_info', {})
@@ -489,33 +711,28 @@ class WorkflowREPL(cmd.Cmd):
             print(" REQUEST PREVIEW (Will NOT be sent)")
             print("="*70)
 
+            # Encode once in the single-line layout; only re-encode when pretty output is wanted
+            compact_text = json.dumps(payload, ensure_ascii=False)
             api_display.display_api_request(
                 api_type=api_type,
                 api_url=api_url,
                 stage_id=stage_id,
                 step_id=step_id,
-                payload_size=len(json.dumps(payload, ensure_ascii=False))
+                payload_size=len(compact_text)
             )
 
             # Format output
             if output_format == 'json':
-                output_text = json.dumps(payload, ensure_ascii=False)
+                output_text = compact_text
             else:
-                output_text = json.dumps(payload, indent=2, ensure_ascii=False)
+                output_text = _dumps(payload, pretty=True)
 
             # Display payload
             print("\n" + "="*70)
             print(" REQUEST PAYLOAD")
             print("="*70)
 
-            try:
-                from rich.syntax import Syntax
-                from rich.console import Console
-                console = Console()
-                syntax = Syntax(output_text, "json", theme="monokai", line_numbers=True)
-                console.print(syntax)
-            except ImportError:
-                print(output_text)
+            _write_highlighted_json(output_text)
 
             # Display statistics
             print("\n" + "="*70)
@@ -548,10 +765,11 @@ class WorkflowREPL(cmd.Cmd):
             print("Usage: apply_transition <transition_file> --output <output_file> [--format <json|pretty>]")
             return
 
-        import json
-        from utils.state_file_loader import state_file_loader
-        from utils.state_updater import state_updater
-        from utils.api_display import api_display
+        if not self._check_deps():
+            return
+
+        state_updater = self._state_updater
+        api_display = self._api_display
 
         # Check if state is loaded
         if not hasattr(self, '_loaded_state'):
@@ -559,7 +777,7 @@ class WorkflowREPL(cmd.Cmd):
             return
 
         # Parse arguments
-        args = arg.split()
+        args, flags = _parse_args(arg, value_flags=('output', 'format'))
         if len(args) < 1:
             print("❌ Missing transition file path")
             return
@@ -567,19 +785,8 @@ class WorkflowREPL(cmd.Cmd):
         transition_file = args[0]
 
         # Parse optional arguments
-        output_file = None
-        output_format = 'pretty'
-
-        i = 1
-        while i < len(args):
-            if args[i] == '--output' and i + 1 < len(args):
-                output_file = args[i + 1]
-                i += 2
-            elif args[i] == '--format' and i + 1 < len(args):
-                output_format = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        output_file = flags.get('output')
+        output_format = flags.get('format', 'pretty')
 
         if not output_file:
             print("❌ Missing --output parameter")
@@ -609,7 +816,7 @@ class WorkflowREPL(cmd.Cmd):
 
             # Apply transition
             print("\n🔄 Applying transition...")
-            updated_state = state_updater.apply_transition(
+            updated_state, _ = state_updater.apply_transition(
                 state=state_json,
                 transition_response=transition_content,
                 transition_type='auto'
@@ -617,52 +824,31 @@ class WorkflowREPL(cmd.Cmd):
 
             # Display updated state info
             print("\n✅ Transition Applied Successfully!")
-            parsed_updated = state_file_loader.parse_state_for_api(updated_state)
+            parsed_updated = self._state_loader.parse_state_for_api(updated_state)
             print("\n Updated State:")
             api_display.display_state_info(parsed_updated)
 
             # Show what changed
             print("\n📊 Changes:")
-            original_fsm = state_json.get('state', {}).get('FSM', {})
-            updated_fsm = updated_state.get('state', {}).get('FSM', {})
-
-            if original_fsm.get('state') != updated_fsm.get('state'):
-                print(f"   FSM State: {original_fsm.get('state', 'UNKNOWN')} → {updated_fsm.get('state', 'UNKNOWN')}")
-
-            if original_fsm.get('last_transition') != updated_fsm.get('last_transition'):
-                print(f"   Last Transition: {original_fsm.get('last_transition', 'None')} → {updated_fsm.get('last_transition', 'None')}")
-
-            original_stage = self._loaded_state.get('stage_id')
-            updated_stage = parsed_updated.get('stage_id')
-            if original_stage != updated_stage:
-                print(f"   Stage ID: {original_stage or 'None'} → {updated_stage or 'None'}")
-
-            original_step = self._loaded_state.get('step_id')
-            updated_step = parsed_updated.get('step_id')
-            if original_step != updated_step:
-                print(f"   Step ID: {original_step or 'None'} → {updated_step or 'None'}")
-
-            # Format output
-            if output_format == 'json':
-                output_text = json.dumps(updated_state, ensure_ascii=False)
-            else:
-                output_text = json.dumps(updated_state, indent=2, ensure_ascii=False)
+            for label, path, default in _DIFF_FIELDS:
+                original_value = _dig(state_json, path)
+                updated_value = _dig(updated_state, path)
+                if original_value != updated_value:
+                    print(f"   {label}: {original_value or default} → {updated_value or default}")
 
-            # Export to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(output_text)
+            # Export to file, encoding straight into the file handle
+            size = _dump_to_file(updated_state, output_file, pretty=output_format != 'json')
 
             print(f"\n💾 Updated state exported to: {output_file}")
             print(f"   Format: {output_format}")
-            print(f"   Size: {len(output_text)} bytes ({len(output_text)/1024:.2f} KB)")
+            print(f"   Size: {size} bytes ({size/1024:.2f} KB)")
 
             print("\n" + "="*70)
             print("✅ Transition applied and state exported successfully")
             print("="*70)
 
             # Update the loaded state to the new state
-            self._loaded_state_json = updated_state
-            self._loaded_state = parsed_updated
+            self._set_loaded_state(updated_state, parsed_updated)
             print("\n📌 Loaded state has been updated to the new state")
 
         except FileNotFoundError as e:
@@ -692,10 +878,11 @@ class WorkflowREPL(cmd.Cmd):
 
         from models.cell import CellType
 
+        type_counts = self.cli.notebook_store.get_type_counts()
         for cell_type in CellType:
-            cells = self.cli.notebook_store.get_cells_by_type(cell_type)
-            if cells:
-                print(f"  {cell_type.value}: {len(cells)}")
+            count = type_counts.get(cell_type)
+            if count:
+                print(f"  {cell_type.value}: {count}")
 
     # ==============================================
     # System Commands
@@ -722,42 +909,21 @@ class WorkflowREPL(cmd.Cmd):
             super().do_help(arg)
         else:
             # Show all commands
-            print("\n📚 Available Commands:\n")
-            print("Workflow:")
-            print("  status          - Show workflow status")
-            print("  start [desc]    - Start new workflow")
-            print("  show [file]     - Show notebook content")
-            print("  list            - List all notebooks")
-            print("  export          - Export to markdown")
-            print()
-            print("State Machine:")
-            print("  transition      - Trigger state transition")
-            print("  reset           - Reset state machine")
-            print()
-            print("State Management: (NEW)")
-            print("  load_state <file>              - Load state from JSON file")
-            print("  send_api [type] [opts]         - Send API (auto-inferred or specify type)")
-            print("  test_request [type] [opts]     - Preview API request (auto-inferred or specify type)")
-            print("  apply_transition <xml> [opts]  - Apply transition XML to loaded state")
-            print()
-            print("Context:")
-            print("  var             - Variable operations")
-            print("  todo            - TODO list operations")
-            print("  effect          - Show effect history")
-            print()
-            print("Code Execution:")
-            print("  exec            - Execute Python code")
-            print("  namespace       - Show namespace variables")
-            print()
-            print("Notebook:")
-            print("  save [file]     - Save current notebook")
-            print("  cells           - Show cell statistics")
-            print()
-            print("System:")
-            print("  clear           - Clear screen")
-            print("  help            - Show this help")
-            print("  quit/exit       - Exit REPL")
-            print()
+            sys.stdout.write(_HELP_TEXT)
+
+    def completenames(self, text, *ignored):
+        """Complete command names from the precomputed command list."""
+        return [name for name in self._commands if name.startswith(text)]
+
+    def onecmd(self, line):
+        """Dispatch empty input and bare no-argument commands directly, everything else via Cmd."""
+        command = line.strip()
+        if not command:
+            return False
+        handler = self._noarg.get(command)
+        if handler is not None:
+            return handler('')
+        return super().onecmd(line)
 
     def default(self, line):
         """Handle unknown commands."""
@@ -775,3 +941,9 @@ class WorkflowREPL(cmd.Cmd):
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
             return
+        finally:
+            # Close the loop shared by API commands however the REPL exits
+            loop = self._loop
+            if loop is not None and not loop.is_closed():
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
@@ -2,34 +2,18 @@
 Main WorkflowCLI class - combines all command functionality.
 """
 
-import json
+from importlib import import_module
 from cli.base import BaseCommand, CLIHelpers
-from cli.commands import (
-    StartCommand,
-    StateCommands,
-    NotebookCommands,
-    APICommands,
-    BasicCommands
-)
-from cli.argument_parser import CLIArgumentParser
-
-
-class WorkflowCLI(
-    BaseCommand,
-    CLIHelpers,
-    StartCommand,
-    StateCommands,
-    NotebookCommands,
-    APICommands,
-    BasicCommands
-):
+
+
+class WorkflowCLI(BaseCommand, CLIHelpers):
     """
     Command-line interface for the workflow system.
-    Combines all command functionality through multiple inheritance.
 
-    Inheritance hierarchy:
-    - BaseCommand: Core initialization and stores
-    - CLIHelpers: Helper methods for state/action handling
+    Core state and helpers come from BaseCommand and CLIHelpers; the
+    commands themselves live in command groups (cli/commands/) that are
+    imported and bound to this CLI the first time one of their cmd_*
+    methods is looked up:
     - StartCommand: start command and iteration loop
     - StateCommands: resume, test-request, apply-transition
     - NotebookCommands: show, list, export, export-markdown
@@ -37,6 +21,38 @@ class WorkflowCLI(
     - BasicCommands: status, repl
     """
 
+    # Command name -> handler method name, used by run() for dispatch
+    _COMMAND_TABLE = {
+        'start': 'cmd_start',
+        'status': 'cmd_status',
+        'show': 'cmd_show',
+        'list': 'cmd_list',
+        'export': 'cmd_export',
+        'repl': 'cmd_repl',
+        'send-api': 'cmd_send_api',
+        'resume': 'cmd_resume',
+        'test-request': 'cmd_test_request',
+        'apply-transition': 'cmd_apply_transition',
+        'test-actions': 'cmd_test_actions',
+        'export-markdown': 'cmd_export_markdown',
+    }
+
+    # Handler method name -> (module, class) of the command group defining it
+    _COMMAND_GROUPS = {
+        'cmd_start': ('cli.commands.start_command', 'StartCommand'),
+        'cmd_resume': ('cli.commands.state_commands', 'StateCommands'),
+        'cmd_test_request': ('cli.commands.state_commands', 'StateCommands'),
+        'cmd_apply_transition': ('cli.commands.state_commands', 'StateCommands'),
+        'cmd_show': ('cli.commands.notebook_commands', 'NotebookCommands'),
+        'cmd_list': ('cli.commands.notebook_commands', 'NotebookCommands'),
+        'cmd_export': ('cli.commands.notebook_commands', 'NotebookCommands'),
+        'cmd_export_markdown': ('cli.commands.notebook_commands', 'NotebookCommands'),
+        'cmd_send_api': ('cli.commands.api_commands', 'APICommands'),
+        'cmd_test_actions': ('cli.commands.api_commands', 'APICommands'),
+        'cmd_status': ('cli.commands.basic_commands', 'BasicCommands'),
+        'cmd_repl': ('cli.commands.basic_commands', 'BasicCommands'),
+    }
+
     def __init__(self, max_steps=0, interactive=False):
         """
         Initialize the CLI.
@@ -48,9 +64,31 @@ class WorkflowCLI(
         # Call BaseCommand's __init__ to initialize all stores
         BaseCommand.__init__(self, max_steps, interactive)
 
+        # Argument parser, built on first use by create_parser()
+        self._parser = None
+
+    def __getattr__(self, name):
+        """Resolve cmd_* methods through their command group."""
+        target = WorkflowCLI._COMMAND_GROUPS.get(name)
+        if target is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(self._get_command_group(*target), name)
+
+    def _get_command_group(self, module_path, class_name):
+        """Get the command group instance for this CLI, creating it on first use."""
+        groups = self.__dict__.setdefault('_command_groups', {})
+        group = groups.get(class_name)
+        if group is None:
+            group_cls = getattr(import_module(module_path), class_name)
+            group = groups[class_name] = group_cls(self)
+        return group
+
     def create_parser(self):
-        """Create argument parser."""
-        return CLIArgumentParser.create_parser()
+        """Create argument parser (built once and reused by later runs)."""
+        if self._parser is None:
+            from cli.argument_parser import CLIArgumentParser
+            self._parser = CLIArgumentParser.create_parser()
+        return self._parser
 
     def run(self, argv=None):
         """Run the CLI."""
@@ -86,8 +124,13 @@ class WorkflowCLI(
 
         # Apply custom context
         if args.custom_context:
+            try:
+                from orjson import loads
+            except ImportError:
+                from json import loads
+
             # Parse as JSON string
-            custom_ctx = json.loads(args.custom_context)
+            custom_ctx = loads(args.custom_context)
             if custom_ctx:
                 print(f"Custom context loaded: {list(custom_ctx.keys())}")
                 self.ai_context_store.set_custom_context(custom_ctx)
@@ -100,22 +143,8 @@ class WorkflowCLI(
             return
 
         # Dispatch to command handler
-        command_handlers = {
-            'start': self.cmd_start,
-            'status': self.cmd_status,
-            'show': self.cmd_show,
-            'list': self.cmd_list,
-            'export': self.cmd_export,
-            'repl': self.cmd_repl,
-            'send-api': self.cmd_send_api,
-            'resume': self.cmd_resume,
-            'test-request': self.cmd_test_request,
-            'apply-transition': self.cmd_apply_transition,
-            'test-actions': self.cmd_test_actions,
-            'export-markdown': self.cmd_export_markdown,
-        }
-
-        handler = command_handlers.get(args.command)
+        method_name = self._COMMAND_TABLE.get(args.command)
+        handler = getattr(self, method_name) if method_name else None
         if handler:
             handler(args)
         else:
@@ -127,6 +156,10 @@ def main():
     """Main entry point."""
     # Get default config from environment
     from config import Config
+    from core.async_state_machine import use_uvloop
+
+    # Faster event loop for API streaming, when installed
+    use_uvloop()
 
     cli = WorkflowCLI(
         max_steps=Config.MAX_EXECUTION_STEPS,
@@ -53,31 +53,36 @@ class Config:
     @classmethod
     def _rebuild_api_urls(cls):
         """Rebuild API URLs after base URL changes."""
+        # Keep the URL attributes in sync with the base URLs
+        for attr, (base_attr, path) in cls._ENDPOINTS.items():
+            setattr(cls, attr, getattr(cls, base_attr) + path)
+
+    # URL attribute -> (base URL attribute, path); set by _rebuild_api_urls
+    _ENDPOINTS = {
         # Workflow API endpoints
-        cls.FEEDBACK_API_URL = f"{cls.DSLC_BASE_URL}/planning"
-        cls.BEHAVIOR_API_URL = f"{cls.DSLC_BASE_URL}/generating"
-        cls.REFLECTING_API_URL = f"{cls.DSLC_BASE_URL}/reflecting"
-        cls.GENERATE_API_URL = f"{cls.DSLC_BASE_URL}/generate"
+        'FEEDBACK_API_URL': ('DSLC_BASE_URL', '/planning'),
+        'BEHAVIOR_API_URL': ('DSLC_BASE_URL', '/generating'),
+        'REFLECTING_API_URL': ('DSLC_BASE_URL', '/reflecting'),
+        'GENERATE_API_URL': ('DSLC_BASE_URL', '/generate'),
 
         # Code execution API endpoints
-        cls.NOTEBOOK_INITIALIZE_URL = f"{cls.BACKEND_BASE_URL}/initialize"
-        cls.NOTEBOOK_EXECUTE_URL = f"{cls.BACKEND_BASE_URL}/execute"
-        cls.NOTEBOOK_STATUS_URL = f"{cls.BACKEND_BASE_URL}/get_status"
-        cls.NOTEBOOK_CANCEL_URL = f"{cls.BACKEND_BASE_URL}/cancel"
-        cls.NOTEBOOK_RESTART_URL = f"{cls.BACKEND_BASE_URL}/restart_kernel"
-
-    # Workflow API endpoints
-    FEEDBACK_API_URL = f"{DSLC_BASE_URL}/planning"
-    BEHAVIOR_API_URL = f"{DSLC_BASE_URL}/generating"
-    REFLECTING_API_URL = f"{DSLC_BASE_URL}/reflecting"
-    GENERATE_API_URL = f"{DSLC_BASE_URL}/generate"
-
-    # Code execution API endpoints
-    NOTEBOOK_INITIALIZE_URL = f"{BACKEND_BASE_URL}/initialize"
-    NOTEBOOK_EXECUTE_URL = f"{BACKEND_BASE_URL}/execute"
-    NOTEBOOK_STATUS_URL = f"{BACKEND_BASE_URL}/get_status"
-    NOTEBOOK_CANCEL_URL = f"{BACKEND_BASE_URL}/cancel"
-    NOTEBOOK_RESTART_URL = f"{BACKEND_BASE_URL}/restart_kernel"
+        'NOTEBOOK_INITIALIZE_URL': ('BACKEND_BASE_URL', '/initialize'),
+        'NOTEBOOK_EXECUTE_URL': ('BACKEND_BASE_URL', '/execute'),
+        'NOTEBOOK_STATUS_URL': ('BACKEND_BASE_URL', '/get_status'),
+        'NOTEBOOK_CANCEL_URL': ('BACKEND_BASE_URL', '/cancel'),
+        'NOTEBOOK_RESTART_URL': ('BACKEND_BASE_URL', '/restart_kernel'),
+    }
+
+    # Endpoint URLs, built from _ENDPOINTS when this module is imported
+    FEEDBACK_API_URL: str
+    BEHAVIOR_API_URL: str
+    REFLECTING_API_URL: str
+    GENERATE_API_URL: str
+    NOTEBOOK_INITIALIZE_URL: str
+    NOTEBOOK_EXECUTE_URL: str
+    NOTEBOOK_STATUS_URL: str
+    NOTEBOOK_CANCEL_URL: str
+    NOTEBOOK_RESTART_URL: str
 
     # ==============================================
     # Context Compression Settings
@@ -168,5 +173,5 @@ class Config:
         }
 
 
-# Initialize on import
-Config.ensure_directories()
+# Build the endpoint URLs from the configured base URLs
+Config._rebuild_api_urls()
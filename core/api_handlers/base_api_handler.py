@@ -4,6 +4,7 @@ Base API Handler
 Provides common functionality for all API handlers.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, AsyncIterator, Union
 from silantui import ModernLogger
@@ -67,24 +68,72 @@ class BaseAPIHandler(ABC, ModernLogger):
         Returns:
             Tuple of (stage_id, step_id)
         """
-        observation = state_data.get('observation', {})
-        location = observation.get('location', {})
-        current = location.get('current', {})
-
-        stage_id = current.get('stage_id', 'unknown')
-        step_id = current.get('step_id', 'none')
+        try:
+            current = state_data['observation']['location']['current']
+            stage_id = current.get('stage_id', 'unknown')
+            step_id = current.get('step_id', 'none')
+        except (KeyError, TypeError, AttributeError):
+            stage_id, step_id = 'unknown', 'none'
 
         return stage_id, step_id
 
-    def _should_log(self) -> bool:
+    def _resolve_location(
+        self,
+        state_data: Dict[str, Any],
+        stage_id: Optional[str],
+        step_id: Optional[str]
+    ) -> tuple[str, str]:
         """
-        Determine if this API call should be logged.
+        Fill in whichever of stage_id/step_id the caller did not pass.
+
+        State data is only inspected when one of them is missing.
+
+        Args:
+            state_data: Current state JSON
+            stage_id: Stage ID passed by the caller, if any
+            step_id: Step ID passed by the caller, if any
 
         Returns:
-            True if logging is enabled (always False now, logging moved to TransitionHandlers)
+            Tuple of (stage_id, step_id)
+        """
+        if stage_id and step_id:
+            return stage_id, step_id
+
+        extracted_stage_id, extracted_step_id = self._extract_location_info(state_data)
+        return stage_id or extracted_stage_id, step_id or extracted_step_id
+
+    async def _iter_actions(
+        self,
+        actions: AsyncIterator[Dict[str, Any]],
+        tag: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Re-yield actions from an API stream, logging completion and errors.
+
+        Per-action debug lines are only emitted when DEBUG is enabled.
+
+        Args:
+            actions: Action stream returned by the API client
+            tag: Log prefix, e.g. 'GeneratingAPI'
+
+        Yields:
+            Action dictionaries from the API response stream
         """
-        # Logging is now handled by TransitionHandlers, not API client
-        return False
+        # Decided once per stream; bound once since it is called for every action
+        debug = self.debug if self.logger.isEnabledFor(logging.DEBUG) else None
+        try:
+            action_count = 0
+            async for action in actions:
+                action_count += 1
+                if debug is not None:
+                    debug("[%s] Action %d received: %s", tag, action_count, action.get('type', 'unknown'))
+                yield action
+
+            self.info("[%s] Completed streaming %d actions", tag, action_count)
+
+        except Exception as e:
+            self.error(f"[{tag}] API call failed: {e}")
+            raise
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}"
@@ -5,7 +5,7 @@ Handles calls to the Generating API (/generating endpoint).
 Returns a stream of actions to execute in the notebook.
 """
 
-from typing import Dict, Any, Optional, AsyncIterator
+from typing import Dict, Any, Optional, AsyncIterator, List, Union
 from .base_api_handler import BaseAPIHandler
 
 
@@ -40,7 +40,7 @@ class GeneratingAPIHandler(BaseAPIHandler):
         """
         super().__init__(api_client, handler_name or 'GeneratingAPIHandler')
 
-    async def call(
+    def call(
         self,
         state_data: Dict[str, Any],
         stage_id: str = None,
@@ -48,8 +48,9 @@ class GeneratingAPIHandler(BaseAPIHandler):
         stream: bool = True,
         transition_name: Optional[str] = None,
         behavior_feedback: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1,
         **kwargs
-    ) -> AsyncIterator[Dict[str, Any]]:
+    ) -> AsyncIterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Call the Generating API.
 
@@ -60,36 +61,55 @@ class GeneratingAPIHandler(BaseAPIHandler):
             stream: Whether to use streaming (True recommended)
             transition_name: Optional transition name for logging
             behavior_feedback: Optional behavior execution feedback
+            batch_size: Group actions into lists of up to this many
+                (default 1: yield each action on its own)
             **kwargs: Additional parameters (ignored)
 
-        Yields:
-            Action dictionaries from the API response stream
+        Returns:
+            Async iterator of action dictionaries from the API response stream,
+            or of action lists when batch_size > 1
         """
         # Extract location info if not provided
-        if not stage_id or not step_id:
-            extracted_stage_id, extracted_step_id = self._extract_location_info(state_data)
-            stage_id = stage_id or extracted_stage_id
-            step_id = step_id or extracted_step_id
+        stage_id, step_id = self._resolve_location(state_data, stage_id, step_id)
 
         self.info(f"[GeneratingAPI] Calling Generating API (stage={stage_id}, step={step_id}, stream={stream})")
 
         # Delegate to api_client (which returns an AsyncIterator)
-        try:
-            action_count = 0
-            async for action in self.api_client.fetch_behavior_actions(
-                stage_id=stage_id,
-                step_index=step_id,  # API client uses step_index parameter
-                state=state_data,
-                stream=stream,
-                transition_name=transition_name,
-                behavior_feedback=behavior_feedback
-            ):
-                action_count += 1
-                self.debug(f"[GeneratingAPI] Action {action_count} received: {action.get('type', 'unknown')}")
-                yield action
-
-            self.info(f"[GeneratingAPI] Completed streaming {action_count} actions")
-
-        except Exception as e:
-            self.error(f"[GeneratingAPI] API call failed: {e}")
-            raise
+        actions = self.api_client.fetch_behavior_actions(
+            stage_id=stage_id,
+            step_index=step_id,  # API client uses step_index parameter
+            state=state_data,
+            stream=stream,
+            transition_name=transition_name,
+            behavior_feedback=behavior_feedback
+        )
+
+        actions = self._iter_actions(actions, 'GeneratingAPI')
+
+        if batch_size > 1:
+            return self._batch_actions(actions, batch_size)
+        return actions
+
+    @staticmethod
+    async def _batch_actions(
+        actions: AsyncIterator[Dict[str, Any]],
+        batch_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Group an action stream into lists of up to batch_size actions.
+
+        Args:
+            actions: Action stream
+            batch_size: Maximum actions per batch
+
+        Yields:
+            Lists of actions; the last one may be shorter
+        """
+        batch = []
+        async for action in actions:
+            batch.append(action)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -5,6 +5,7 @@ Handles calls to the Planning API (/planning endpoint).
 Used to check if stage/step goals are achieved.
 """
 
+import logging
 from typing import Dict, Any, Optional
 from .base_api_handler import BaseAPIHandler
 
@@ -60,10 +61,7 @@ class PlanningAPIHandler(BaseAPIHandler):
             Planning API response dict
         """
         # Extract location info if not provided
-        if not stage_id or not step_id:
-            extracted_stage_id, extracted_step_id = self._extract_location_info(state_data)
-            stage_id = stage_id or extracted_stage_id
-            step_id = step_id or extracted_step_id
+        stage_id, step_id = self._resolve_location(state_data, stage_id, step_id)
 
         self.info(f"[PlanningAPI] Calling Planning API (stage={stage_id}, step={step_id})")
 
@@ -79,11 +77,13 @@ class PlanningAPIHandler(BaseAPIHandler):
             )
 
             # Handle both JSON dict and XML string responses
-            if isinstance(response, dict):
-                self.info(f"[PlanningAPI] Response received (targetAchieved={response.get('targetAchieved')})")
-            else:
-                # XML or string response
-                self.info(f"[PlanningAPI] Response received (XML/text, {len(str(response))} chars)")
+            if self.logger.isEnabledFor(logging.INFO):
+                if isinstance(response, dict):
+                    self.info(f"[PlanningAPI] Response received (targetAchieved={response.get('targetAchieved')})")
+                else:
+                    # XML or string response
+                    size = len(response) if isinstance(response, (str, bytes)) else len(str(response))
+                    self.info(f"[PlanningAPI] Response received (XML/text, {size} chars)")
 
             return response
 
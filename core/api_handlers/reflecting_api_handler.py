@@ -34,7 +34,7 @@ class ReflectingAPIHandler(BaseAPIHandler):
         """
         super().__init__(api_client, handler_name or 'ReflectingAPIHandler')
 
-    async def call(
+    def call(
         self,
         state_data: Dict[str, Any],
         stage_id: str = None,
@@ -57,35 +57,23 @@ class ReflectingAPIHandler(BaseAPIHandler):
             stream: Whether to use streaming (default: True)
             **kwargs: Additional parameters (ignored)
 
-        Yields:
-            Action dictionaries from the API response stream
+        Returns:
+            Async iterator of action dictionaries from the API response stream
         """
         # Extract location info if not provided
-        if not stage_id or not step_id:
-            extracted_stage_id, extracted_step_id = self._extract_location_info(state_data)
-            stage_id = stage_id or extracted_stage_id
-            step_id = step_id or extracted_step_id
+        stage_id, step_id = self._resolve_location(state_data, stage_id, step_id)
 
         self.info(f"[ReflectingAPI] Calling Reflecting API (stage={stage_id}, step={step_id}, stream={stream})")
 
         # Delegate to api_client (which returns an AsyncIterator)
-        try:
-            action_count = 0
-            async for action in self.api_client.send_reflecting(
-                stage_id=stage_id,
-                step_index=step_id,  # API client uses step_index parameter
-                state=state_data,
-                notebook_id=notebook_id,
-                behavior_feedback=behavior_feedback,
-                stream=stream,
-                transition_name=transition_name
-            ):
-                action_count += 1
-                self.debug(f"[ReflectingAPI] Action {action_count} received: {action.get('type', 'unknown')}")
-                yield action
+        actions = self.api_client.send_reflecting(
+            stage_id=stage_id,
+            step_index=step_id,  # API client uses step_index parameter
+            state=state_data,
+            notebook_id=notebook_id,
+            behavior_feedback=behavior_feedback,
+            stream=stream,
+            transition_name=transition_name
+        )
 
-            self.info(f"[ReflectingAPI] Completed streaming {action_count} actions")
-
-        except Exception as e:
-            self.error(f"[ReflectingAPI] API call failed: {e}")
-            raise
+        return self._iter_actions(actions, 'ReflectingAPI')
@@ -10,11 +10,136 @@ Responsibilities:
 - Contains no business logic, only coordination
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+from concurrent.futures import Executor
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from silantui import ModernLogger
+from utils.xml_parser import planning_xml_parser
 from .state_machine import WorkflowStateMachine
 from .events import WorkflowEvent
-from .states import WorkflowState
+from .states import WorkflowState, WORKFLOW_STATES
+from .state_classes.state_factory import StateFactory
+from .transition_handlers import get_transition_coordinator
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import simdjson
+    # Reused across calls so the parser keeps its internal buffers
+    _simd_parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _simd_parser = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _parse_json_response(data):
+    """
+    Parse a JSON API response body.
+
+    Uses pysimdjson when installed (fastest on large action lists),
+    otherwise orjson, otherwise the stdlib json module.
+
+    Args:
+        data: JSON text (str or bytes)
+
+    Returns:
+        Parsed JSON as plain Python objects
+    """
+    if _simd_parser is None:
+        return json_loads(data)
+
+    doc = _simd_parser.parse(data.encode('utf-8') if isinstance(data, str) else data)
+    # Materialize before the parser is reused by the next call
+    if isinstance(doc, simdjson.Object):
+        return doc.as_dict()
+    if isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    return doc
+
+
+def use_uvloop() -> bool:
+    """
+    Install uvloop's event loop policy if uvloop is available.
+
+    The adapter spends most of its time awaiting streamed API actions,
+    which is where uvloop's lower per-iteration overhead pays off. Call
+    this once at program entry, before any event loop is created;
+    asyncio.run() and asyncio.new_event_loop() pick the policy up.
+
+    Returns:
+        True if uvloop is now in use, False if it is not installed
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+# FSM state string -> WorkflowState, including the '*_COMPLETE' spellings
+# some state files use for the '*_COMPLETED' states
+_STATE_LOOKUP: Dict[str, WorkflowState] = {
+    **WORKFLOW_STATES,
+    **{state.value[:-1]: state for state in WorkflowState if state.value.endswith('_COMPLETED')},
+}
+
+
+def _resolve_fsm_state(fsm_state_str: str) -> Optional[WorkflowState]:
+    """
+    Resolve an FSM state string from a state file to its WorkflowState.
+
+    Accepts any casing and the '*_COMPLETE' spellings.
+
+    Args:
+        fsm_state_str: Value of state.FSM.state
+
+    Returns:
+        WorkflowState, or None if the string is not a known state
+    """
+    return _STATE_LOOKUP.get(fsm_state_str) or _STATE_LOOKUP.get(str(fsm_state_str).upper())
+
+
+# Mapping table: (current_state, api_type) -> transition_handler_name
+# This table encodes the deterministic state machine behavior
+_STATE_API_TO_TRANSITION: Mapping[Tuple[str, str], str] = MappingProxyType({
+    # IDLE state calls planning API -> START_WORKFLOW transition
+    ('IDLE', 'planning'): 'START_WORKFLOW',
+
+    # STAGE_RUNNING state calls planning API -> START_STEP transition
+    ('STAGE_RUNNING', 'planning'): 'START_STEP',
+
+    # STEP_RUNNING state calls planning API -> START_BEHAVIOR transition
+    ('STEP_RUNNING', 'planning'): 'START_BEHAVIOR',
+
+    # BEHAVIOR_RUNNING state calls generating API -> COMPLETE_BEHAVIOR transition
+    ('BEHAVIOR_RUNNING', 'generating'): 'COMPLETE_BEHAVIOR',
+
+    # BEHAVIOR_COMPLETED state calls reflecting API -> NEXT_BEHAVIOR or COMPLETE_STEP
+    # Predict most common case (COMPLETE_STEP)
+    ('BEHAVIOR_COMPLETED', 'reflecting'): 'COMPLETE_STEP',
+
+    # STEP_COMPLETED state calls reflecting API -> NEXT_STEP or COMPLETE_STAGE
+    # Predict most common case (COMPLETE_STAGE)
+    ('STEP_COMPLETED', 'reflecting'): 'COMPLETE_STAGE',
+
+    # STAGE_COMPLETED state calls reflecting API -> NEXT_STAGE or COMPLETE_WORKFLOW
+    # Predict most common case (COMPLETE_WORKFLOW)
+    ('STAGE_COMPLETED', 'reflecting'): 'COMPLETE_WORKFLOW',
+})
+
+
+# API types whose call_api() returns an async iterator of actions
+_STREAMING_API_TYPES = frozenset({'generating', 'reflecting'})
 
 
 class AsyncStateMachineAdapter(ModernLogger):
@@ -36,7 +161,8 @@ class AsyncStateMachineAdapter(ModernLogger):
         self,
         state_machine: WorkflowStateMachine,
         api_client=None,
-        script_store=None
+        script_store=None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize async adapter
@@ -45,24 +171,27 @@ class AsyncStateMachineAdapter(ModernLogger):
             state_machine: Wrapped state machine instance
             api_client: WorkflowAPIClient instance for API operations
             script_store: ScriptStore instance for action execution
+            executor: Optional executor to apply transitions in. Transitions
+                run actions synchronously (including code cells), so passing
+                a ThreadPoolExecutor keeps the event loop free meanwhile.
+                Steps must still be awaited one at a time.
         """
         super().__init__("AsyncStateMachine")
         self.state_machine = state_machine
         self.api_client = api_client
         self.script_store = script_store
+        self.executor = executor
 
         # Track last executed transition name
         self._last_transition_name: Optional[str] = None
 
         # Inject API client into StateFactory for all states
         if api_client:
-            from .state_classes.state_factory import StateFactory
             StateFactory.set_api_client(api_client)
             self.info("API client injected into StateFactory")
 
         # Inject script_store and api_client into TransitionCoordinator
         if script_store or api_client:
-            from core.transition_handlers import get_transition_coordinator
             coordinator = get_transition_coordinator()
             if script_store:
                 coordinator.set_script_store(script_store)
@@ -85,12 +214,10 @@ class AsyncStateMachineAdapter(ModernLogger):
         self.api_client = api_client
 
         # Inject into StateFactory for all states
-        from .state_classes.state_factory import StateFactory
         StateFactory.set_api_client(api_client)
         self.info("API client injected into StateFactory")
 
         # Inject into TransitionCoordinator
-        from core.transition_handlers import get_transition_coordinator
         coordinator = get_transition_coordinator()
         coordinator.set_api_client(api_client)
         self.info("API client injected into TransitionCoordinator")
@@ -117,28 +244,23 @@ class AsyncStateMachineAdapter(ModernLogger):
         # Reset transition name tracking
         self._last_transition_name = None
 
-        # Extract current FSM state from state JSON
-        fsm_state_str = state_json.get('state', {}).get('FSM', {}).get('state', 'UNKNOWN')
-
-        # Normalize state name (handle COMPLETE vs COMPLETED variants)
-        normalized_state = fsm_state_str.upper()
-        if normalized_state.endswith('_COMPLETE') and not normalized_state.endswith('_COMPLETED'):
-            normalized_state = normalized_state + 'D'
+        # Checked once so disabled info lines cost neither a call nor formatting
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
 
+        # Extract current FSM state from state JSON
         try:
-            # First attempt direct match (lowercase)
-            current_state = WorkflowState(normalized_state.lower())
-        except ValueError:
-            # If failed, try using WORKFLOW_STATES dict (uppercase)
-            from .states import WORKFLOW_STATES
-            if normalized_state in WORKFLOW_STATES:
-                current_state = WORKFLOW_STATES[normalized_state]
-            else:
-                self.error(f"Unknown FSM state: {fsm_state_str} (normalized: {normalized_state})")
-                return state_json, None
+            fsm_state_str = state_json['state']['FSM']['state']
+        except (KeyError, TypeError):
+            fsm_state_str = 'UNKNOWN'
+
+        # Resolve state name (handles lowercase and COMPLETE vs COMPLETED variants)
+        current_state = _resolve_fsm_state(fsm_state_str)
+        if current_state is None:
+            self.error(f"Unknown FSM state: {fsm_state_str}")
+            return state_json, None
+        normalized_state = current_state.value
 
-        # Obtain State instance from factory
-        from .state_classes.state_factory import StateFactory
+        # Obtain State instance from factory (which caches instances)
         state_instance = StateFactory.get_state(normalized_state)
 
         if not state_instance:
@@ -150,11 +272,13 @@ class AsyncStateMachineAdapter(ModernLogger):
 
         if not api_type_enum or api_type_enum.value == 'finish':
             # State does not require API call (e.g., terminal states)
-            self.info(f"[AsyncFSM] State {current_state.value} does not require API call")
+            if info_enabled:
+                self.info("[AsyncFSM] State %s does not require API call", current_state.value)
             return state_json, None
 
         try:
-            self.info(f"[AsyncFSM] Calling {api_type_enum.value} API for state: {current_state.value}")
+            if info_enabled:
+                self.info("[AsyncFSM] Calling %s API for state: %s", api_type_enum.value, current_state.value)
 
             # Predict transition name for correct log file naming
             predicted_transition_name = self._predict_transition_name(normalized_state, api_type_enum.value)
@@ -163,15 +287,12 @@ class AsyncStateMachineAdapter(ModernLogger):
             api_response = await state_instance.call_api(state_json, transition_name=predicted_transition_name)
 
             # Pass API response to TransitionCoordinator for processing
-            from core.transition_handlers import get_transition_coordinator
             coordinator = get_transition_coordinator()
 
             # For generating/reflecting APIs, collect async iterator first
-            if api_type_enum.value in ['generating', 'reflecting']:
+            if api_type_enum.value in _STREAMING_API_TYPES:
                 # Collect all actions from async iterator
-                actions = []
-                async for action in api_response:
-                    actions.append(action)
+                actions = [action async for action in api_response]
 
                 # Wrap actions in response format expected by handlers
                 api_response = {'actions': actions, 'count': len(actions)}
@@ -182,22 +303,28 @@ class AsyncStateMachineAdapter(ModernLogger):
                 parsed_response = api_response
             else:
                 # Try to parse as XML first, fallback to JSON
-                from utils.xml_parser import planning_xml_parser
                 try:
                     parsed_response = planning_xml_parser.parse(api_response)
                 except Exception:
                     # If XML parsing fails, try JSON
-                    import json
-                    parsed_response = json.loads(api_response)
+                    parsed_response = _parse_json_response(api_response)
 
-            updated_state, transition_name = coordinator.apply_transition(
+            apply = partial(
+                coordinator.apply_transition,
                 state=state_json,
                 api_response=parsed_response,
                 api_type=api_type_enum.value
             )
+            if self.executor is None:
+                updated_state, transition_name = apply()
+            else:
+                updated_state, transition_name = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, apply
+                )
 
             self._last_transition_name = transition_name
-            self.info(f"[AsyncFSM] Transition applied: {transition_name}")
+            if info_enabled:
+                self.info("[AsyncFSM] Transition applied: %s", transition_name)
 
             return updated_state, transition_name
 
@@ -231,38 +358,10 @@ class AsyncStateMachineAdapter(ModernLogger):
             may differ (e.g., NEXT_BEHAVIOR vs COMPLETE_STEP), but the prediction is
             good enough for log file naming purposes.
         """
-        # Mapping table: (current_state, api_type) -> transition_handler_name
-        # This table encodes the deterministic state machine behavior
-        state_api_to_transition = {
-            # IDLE state calls planning API -> START_WORKFLOW transition
-            ('IDLE', 'planning'): 'START_WORKFLOW',
-
-            # STAGE_RUNNING state calls planning API -> START_STEP transition
-            ('STAGE_RUNNING', 'planning'): 'START_STEP',
-
-            # STEP_RUNNING state calls planning API -> START_BEHAVIOR transition
-            ('STEP_RUNNING', 'planning'): 'START_BEHAVIOR',
-
-            # BEHAVIOR_RUNNING state calls generating API -> COMPLETE_BEHAVIOR transition
-            ('BEHAVIOR_RUNNING', 'generating'): 'COMPLETE_BEHAVIOR',
-
-            # BEHAVIOR_COMPLETED state calls reflecting API -> NEXT_BEHAVIOR or COMPLETE_STEP
-            # Predict most common case (COMPLETE_STEP)
-            ('BEHAVIOR_COMPLETED', 'reflecting'): 'COMPLETE_STEP',
-
-            # STEP_COMPLETED state calls reflecting API -> NEXT_STEP or COMPLETE_STAGE
-            # Predict most common case (COMPLETE_STAGE)
-            ('STEP_COMPLETED', 'reflecting'): 'COMPLETE_STAGE',
-
-            # STAGE_COMPLETED state calls reflecting API -> NEXT_STAGE or COMPLETE_WORKFLOW
-            # Predict most common case (COMPLETE_WORKFLOW)
-            ('STAGE_COMPLETED', 'reflecting'): 'COMPLETE_WORKFLOW',
-        }
-
-        predicted_name = state_api_to_transition.get((state_name, api_type))
+        predicted_name = _STATE_API_TO_TRANSITION.get((state_name, api_type))
 
         if predicted_name:
-            self.debug(f"[AsyncFSM] Predicted transition: {state_name} + {api_type} API -> {predicted_name}")
+            self.debug("[AsyncFSM] Predicted transition: %s + %s API -> %s", state_name, api_type, predicted_name)
             return predicted_name
         else:
             # [INCORRECT NAMING]: Fallback to API type when prediction unavailable
@@ -12,20 +12,34 @@ from typing import List, Dict, Any, Optional
 class WorkflowContext:
     """Minimal workflow context for state machine."""
 
+    __slots__ = ('current_stage_id', 'current_step_id', 'current_behavior_id')
+
     def __init__(self):
         self.current_stage_id: Optional[str] = None
         self.current_step_id: Optional[str] = None
         self.current_behavior_id: Optional[str] = None
 
 
+# Field order of the tuples stored in ExecutionContext._history
+_HISTORY_FIELDS = ('timestamp', 'from_state', 'to_state', 'event', 'payload')
+
+
 class ExecutionContext:
     """Minimal execution context for state machine."""
 
+    __slots__ = ('workflow_context', '_history', 'pending_workflow_data')
+
     def __init__(self):
         self.workflow_context = WorkflowContext()
-        self.history: List[Dict[str, Any]] = []
+        # One tuple per transition; dicts are only built when history is read
+        self._history: List[tuple] = []
         self.pending_workflow_data: Any = None
 
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Transition history, oldest first, as a list of dicts."""
+        return [dict(zip(_HISTORY_FIELDS, entry)) for entry in self._history]
+
     def add_history_entry(
         self,
         timestamp: float,
@@ -35,10 +49,10 @@ class ExecutionContext:
         payload: Any = None
     ) -> None:
         """Add entry to history."""
-        self.history.append({
-            'timestamp': timestamp,
-            'from_state': from_state,
-            'to_state': to_state,
-            'event': event,
-            'payload': payload
-        })
+        self._history.append((timestamp, from_state, to_state, event, payload))
+
+    def reset(self) -> None:
+        """Clear history and workflow position."""
+        self.workflow_context = WorkflowContext()
+        self._history.clear()
+        self.pending_workflow_data = None
@@ -95,28 +95,6 @@ class WorkflowEvent(str, Enum):
     """Resets the machine from a terminal state. Transition: WORKFLOW_COMPLETED | ERROR | CANCELLED -> IDLE"""
 
 
-# For backward compatibility, create a dictionary similar to TypeScript's EVENTS
-EVENTS: Final[dict] = {
-    'START_WORKFLOW': WorkflowEvent.START_WORKFLOW,
-    'START_STEP': WorkflowEvent.START_STEP,
-    'START_BEHAVIOR': WorkflowEvent.START_BEHAVIOR,
-    'START_ACTION': WorkflowEvent.START_ACTION,
-    'COMPLETE_ACTION': WorkflowEvent.COMPLETE_ACTION,
-    'COMPLETE_BEHAVIOR': WorkflowEvent.COMPLETE_BEHAVIOR,
-    'COMPLETE_STEP': WorkflowEvent.COMPLETE_STEP,
-    'COMPLETE_STAGE': WorkflowEvent.COMPLETE_STAGE,
-    'COMPLETE_WORKFLOW': WorkflowEvent.COMPLETE_WORKFLOW,
-    'NEXT_ACTION': WorkflowEvent.NEXT_ACTION,
-    'NEXT_BEHAVIOR': WorkflowEvent.NEXT_BEHAVIOR,
-    'NEXT_STEP': WorkflowEvent.NEXT_STEP,
-    'NEXT_STAGE': WorkflowEvent.NEXT_STAGE,
-    'UPDATE_WORKFLOW': WorkflowEvent.UPDATE_WORKFLOW,
-    'UPDATE_WORKFLOW_CONFIRMED': WorkflowEvent.UPDATE_WORKFLOW_CONFIRMED,
-    'UPDATE_WORKFLOW_REJECTED': WorkflowEvent.UPDATE_WORKFLOW_REJECTED,
-    'UPDATE_STEP': WorkflowEvent.UPDATE_STEP,
-    'UPDATE_STEP_CONFIRMED': WorkflowEvent.UPDATE_STEP_CONFIRMED,
-    'UPDATE_STEP_REJECTED': WorkflowEvent.UPDATE_STEP_REJECTED,
-    'FAIL': WorkflowEvent.FAIL,
-    'CANCEL': WorkflowEvent.CANCEL,
-    'RESET': WorkflowEvent.RESET,
-}
+# For backward compatibility, a dictionary similar to TypeScript's EVENTS.
+# Built from the enum so the two cannot drift apart.
+EVENTS: Final[dict] = dict(WorkflowEvent.__members__)
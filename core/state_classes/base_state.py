@@ -263,12 +263,7 @@ class BaseState(ABC, ModernLogger):
             raise ValueError(f"Reflecting API handler not configured for {self.state_name}")
 
         # Extract stage_id and step_id from state
-        observation = state_data.get('observation', {})
-        location = observation.get('location', {})
-        current = location.get('current', {})
-
-        stage_id = current.get('stage_id', 'unknown')
-        step_id = current.get('step_id', 'none')
+        stage_id, step_id = self._get_location_ids(state_data)
 
         self.info(f"[{self.state_name}] Calling {api_type.value} API (stage={stage_id}, step={step_id})")
 
@@ -383,6 +378,38 @@ class BaseState(ABC, ModernLogger):
             transition_name=transition_name  # Pass transition name for correct log file naming
         )
 
+    def _get_location_ids(self, state_data: Dict[str, Any]) -> tuple[str, str]:
+        """
+        Get the current stage_id and step_id from observation.location.current.
+
+        Args:
+            state_data: Current state JSON
+
+        Returns:
+            Tuple of (stage_id, step_id), defaulting to ('unknown', 'none')
+        """
+        try:
+            current = state_data['observation']['location']['current']
+            return current.get('stage_id', 'unknown'), current.get('step_id', 'none')
+        except (KeyError, TypeError, AttributeError):
+            return 'unknown', 'none'
+
+    def _get_remaining(self, state_data: Dict[str, Any], level: str) -> list:
+        """
+        Get observation.location.progress.<level>.remaining from state data.
+
+        Args:
+            state_data: Current state JSON
+            level: Progress level ('stages', 'steps' or 'behaviors')
+
+        Returns:
+            Remaining items, or an empty list if any part of the path is missing
+        """
+        try:
+            return state_data['observation']['location']['progress'][level]['remaining']
+        except (KeyError, TypeError):
+            return []
+
     def __str__(self) -> str:
         return f"State({self.state_name})"
 
@@ -5,6 +5,7 @@ Represents a behavior that has just completed successfully.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class BehaviorCompletedState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'next_behavior': WorkflowEvent.NEXT_BEHAVIOR,
             'complete_step': WorkflowEvent.COMPLETE_STEP,
@@ -52,8 +52,6 @@ class BehaviorCompletedState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # First, check if effect.current is not empty
         # If not empty, we must transition to NEXT_BEHAVIOR to clear effects
         context = state_data.get('observation', {}).get('context', {})
@@ -95,8 +93,6 @@ class BehaviorCompletedState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -5,6 +5,7 @@ Represents a behavior that is currently being generated/executed.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class BehaviorRunningState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'start_action': WorkflowEvent.START_ACTION,
             'complete_behavior': WorkflowEvent.COMPLETE_BEHAVIOR,
@@ -51,8 +51,6 @@ class BehaviorRunningState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if we have a reflecting response indicating completion
         if api_response and isinstance(api_response, dict):
             # Check for completion signal
@@ -97,8 +95,6 @@ class BehaviorRunningState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -5,6 +5,7 @@ Represents the idle state where the workflow is waiting to begin.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -26,7 +27,6 @@ class IdleState(BaseState):
         Returns:
             Dict of transition names to event names
         """
-        from ..events import WorkflowEvent
         return {
             'start_workflow': WorkflowEvent.START_WORKFLOW,
             'fail': WorkflowEvent.FAIL,
@@ -51,8 +51,6 @@ class IdleState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if we have a planning response with stages
         if api_response and isinstance(api_response, dict):
             if 'stages' in api_response and isinstance(api_response['stages'], list):
@@ -79,8 +77,6 @@ class IdleState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         # Check if event is in valid transitions
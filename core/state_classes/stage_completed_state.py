@@ -5,6 +5,7 @@ Represents a stage that has just completed successfully.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class StageCompletedState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'complete_workflow': WorkflowEvent.COMPLETE_WORKFLOW,
             'next_stage': WorkflowEvent.NEXT_STAGE,
@@ -51,12 +51,8 @@ class StageCompletedState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if there are remaining stages
-        progress = self._get_progress(state_data)
-        stages_progress = progress.get('stages', {})
-        remaining_stages = stages_progress.get('remaining', [])
+        remaining_stages = self._get_remaining(state_data, 'stages')
 
         if not remaining_stages:
             self.info("No remaining stages, completing workflow")
@@ -81,8 +77,6 @@ class StageCompletedState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -90,16 +84,12 @@ class StageCompletedState(BaseState):
 
         # COMPLETE_WORKFLOW requires no remaining stages
         if event == WorkflowEvent.COMPLETE_WORKFLOW:
-            progress = self._get_progress(state_data)
-            stages_progress = progress.get('stages', {})
-            remaining_stages = stages_progress.get('remaining', [])
+            remaining_stages = self._get_remaining(state_data, 'stages')
             return len(remaining_stages) == 0
 
         # NEXT_STAGE requires remaining stages
         if event == WorkflowEvent.NEXT_STAGE:
-            progress = self._get_progress(state_data)
-            stages_progress = progress.get('stages', {})
-            remaining_stages = stages_progress.get('remaining', [])
+            remaining_stages = self._get_remaining(state_data, 'stages')
             return len(remaining_stages) > 0
 
         # Other transitions are allowed
@@ -113,11 +103,3 @@ class StageCompletedState(BaseState):
             APIResponseType.COMPLETE
         """
         return APIResponseType.COMPLETE
-
-    def _get_progress(self, state_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Helper to get progress from state data."""
-        return (
-            state_data.get('observation', {})
-            .get('location', {})
-            .get('progress', {})
-        )
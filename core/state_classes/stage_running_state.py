@@ -5,6 +5,7 @@ Represents a stage that is currently running and ready to execute steps.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class StageRunningState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'start_step': WorkflowEvent.START_STEP,
             'complete_stage': WorkflowEvent.COMPLETE_STAGE,
@@ -52,8 +52,6 @@ class StageRunningState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if we have a planning response with steps
         if api_response and isinstance(api_response, dict):
             if 'steps' in api_response and isinstance(api_response['steps'], list):
@@ -89,8 +87,6 @@ class StageRunningState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -99,9 +95,7 @@ class StageRunningState(BaseState):
         # Additional conditions for specific transitions
         if event == WorkflowEvent.COMPLETE_STAGE:
             # Can only complete if no steps remaining
-            progress = self._get_progress(state_data)
-            steps_progress = progress.get('steps', {})
-            remaining_steps = steps_progress.get('remaining', [])
+            remaining_steps = self._get_remaining(state_data, 'steps')
             return len(remaining_steps) == 0
 
         # START_STEP, FAIL, CANCEL are always allowed
@@ -5,6 +5,7 @@ Represents a step that has just completed successfully.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class StepCompletedState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'complete_stage': WorkflowEvent.COMPLETE_STAGE,
             'next_step': WorkflowEvent.NEXT_STEP,
@@ -51,12 +51,8 @@ class StepCompletedState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if there are remaining steps
-        progress = self._get_progress(state_data)
-        steps_progress = progress.get('steps', {})
-        remaining_steps = steps_progress.get('remaining', [])
+        remaining_steps = self._get_remaining(state_data, 'steps')
 
         if not remaining_steps:
             self.info("No remaining steps, completing stage")
@@ -81,8 +77,6 @@ class StepCompletedState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -90,16 +84,12 @@ class StepCompletedState(BaseState):
 
         # COMPLETE_STAGE requires no remaining steps
         if event == WorkflowEvent.COMPLETE_STAGE:
-            progress = self._get_progress(state_data)
-            steps_progress = progress.get('steps', {})
-            remaining_steps = steps_progress.get('remaining', [])
+            remaining_steps = self._get_remaining(state_data, 'steps')
             return len(remaining_steps) == 0
 
         # NEXT_STEP requires remaining steps
         if event == WorkflowEvent.NEXT_STEP:
-            progress = self._get_progress(state_data)
-            steps_progress = progress.get('steps', {})
-            remaining_steps = steps_progress.get('remaining', [])
+            remaining_steps = self._get_remaining(state_data, 'steps')
             return len(remaining_steps) > 0
 
         # Other transitions are allowed
@@ -113,11 +103,3 @@ class StepCompletedState(BaseState):
             APIResponseType.COMPLETE
         """
         return APIResponseType.COMPLETE
-
-    def _get_progress(self, state_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Helper to get progress from state data."""
-        return (
-            state_data.get('observation', {})
-            .get('location', {})
-            .get('progress', {})
-        )
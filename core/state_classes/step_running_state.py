@@ -5,6 +5,7 @@ Represents a step that is currently running and ready to execute behaviors.
 
 from typing import Dict, Any, Optional
 from .base_state import BaseState
+from ..events import WorkflowEvent
 from core.api_types import APIResponseType
 
 
@@ -24,7 +25,6 @@ class StepRunningState(BaseState):
 
     def get_valid_transitions(self) -> Dict[str, str]:
         """Get valid outgoing transitions."""
-        from ..events import WorkflowEvent
         return {
             'start_behavior': WorkflowEvent.START_BEHAVIOR,
             'complete_step': WorkflowEvent.COMPLETE_STEP,
@@ -52,8 +52,6 @@ class StepRunningState(BaseState):
         Returns:
             WorkflowEvent to trigger
         """
-        from ..events import WorkflowEvent
-
         # Check if we have a planning response with behaviors
         if api_response and isinstance(api_response, dict):
             if 'behaviors' in api_response and isinstance(api_response['behaviors'], list):
@@ -93,8 +91,6 @@ class StepRunningState(BaseState):
         Returns:
             True if transition is allowed
         """
-        from ..events import WorkflowEvent
-
         valid_events = self.get_valid_transitions()
 
         if event not in valid_events.values():
@@ -602,7 +602,7 @@ class WorkflowStateMachine(ModernLogger):
     @property
     def history(self):
         """Get the execution history."""
-        return self.execution_context.execution_history
+        return self.execution_context.history
 
     def get_state_info(self) -> Dict[str, Any]:
         """Get current state information."""
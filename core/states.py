@@ -64,20 +64,6 @@ class WorkflowState(str, Enum):
     """A terminal cancelled state."""
 
 
-# For backward compatibility, create a dictionary similar to TypeScript's WORKFLOW_STATES
-WORKFLOW_STATES: Final[dict] = {
-    'IDLE': WorkflowState.IDLE,
-    'STAGE_RUNNING': WorkflowState.STAGE_RUNNING,
-    'STAGE_COMPLETED': WorkflowState.STAGE_COMPLETED,
-    'STEP_RUNNING': WorkflowState.STEP_RUNNING,
-    'STEP_COMPLETED': WorkflowState.STEP_COMPLETED,
-    'BEHAVIOR_RUNNING': WorkflowState.BEHAVIOR_RUNNING,
-    'BEHAVIOR_COMPLETED': WorkflowState.BEHAVIOR_COMPLETED,
-    'ACTION_RUNNING': WorkflowState.ACTION_RUNNING,
-    'ACTION_COMPLETED': WorkflowState.ACTION_COMPLETED,
-    'WORKFLOW_COMPLETED': WorkflowState.WORKFLOW_COMPLETED,
-    'WORKFLOW_UPDATE_PENDING': WorkflowState.WORKFLOW_UPDATE_PENDING,
-    'STEP_UPDATE_PENDING': WorkflowState.STEP_UPDATE_PENDING,
-    'ERROR': WorkflowState.ERROR,
-    'CANCELLED': WorkflowState.CANCELLED,
-}
+# For backward compatibility, a dictionary similar to TypeScript's WORKFLOW_STATES.
+# Built from the enum so the two cannot drift apart.
+WORKFLOW_STATES: Final[dict] = dict(WorkflowState.__members__)
@@ -6,7 +6,9 @@ Provides common functionality for all FSM transition handlers.
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from copy import deepcopy
+from uuid import uuid4
 from silantui import ModernLogger
+from models.action import ExecutionStep, ActionMetadata
 from utils.transition_logger import get_transition_logger
 
 
@@ -245,26 +247,22 @@ class BaseTransitionHandler(ABC, ModernLogger):
             **kwargs: Additional action parameters
         """
         if not self.script_store:
-            self.debug(f"[Action] Skipping {action_type}: no script_store available")
+            self.debug("[Action] Skipping %s: no script_store available", action_type)
             return
 
         try:
-            # Import here to avoid circular dependency
-            from models.action import ExecutionStep, ActionMetadata
-            import uuid
-
             # Create execution step
             step = ExecutionStep(
                 action=action_type,
                 content=content,
-                store_id=kwargs.get('store_id') or str(uuid.uuid4()),
+                store_id=kwargs.get('store_id') or str(uuid4()),
                 metadata=kwargs.get('metadata') or ActionMetadata(),
                 **{k: v for k, v in kwargs.items() if k not in ['store_id', 'metadata']}
             )
 
             # Execute action
             self.script_store.exec_action(step)
-            self.info(f"[Action] Executed {action_type}: {content[:50] if content else '(no content)'}")
+            self.info("[Action] Executed %s: %s", action_type, content[:50] if content else '(no content)')
 
         except Exception as e:
             self.error(f"[Action] Failed to execute {action_type}: {e}", exc_info=True)
@@ -279,14 +277,13 @@ class BaseTransitionHandler(ABC, ModernLogger):
         Args:
             state: State dictionary to update (modified in-place)
         """
-        if not self.script_store:
-            return
-
-        if not hasattr(self.script_store, 'notebook_store'):
+        # One lookup covers both "no script_store" and "no notebook_store"
+        notebook_store = getattr(self.script_store, 'notebook_store', None)
+        if notebook_store is None:
             return
 
         # Get latest notebook data from store
-        notebook_data = self.script_store.notebook_store.to_dict()
+        notebook_data = notebook_store.to_dict()
 
         # Update state
         if 'state' not in state:
@@ -294,4 +291,4 @@ class BaseTransitionHandler(ABC, ModernLogger):
 
         state['state']['notebook'] = notebook_data
 
-        self.debug(f"[Sync] Updated notebook in state (cells: {len(notebook_data.get('cells', []))})")
+        self.debug("[Sync] Updated notebook in state (cells: %d)", len(notebook_data.get('cells', [])))
@@ -6,9 +6,15 @@ Transition: BEHAVIOR_RUNNING → BEHAVIOR_COMPLETED
 """
 
 from typing import Dict, Any
+from uuid import uuid4
+from models.action import ExecutionStep, ActionMetadata
 from .base_transition_handler import BaseTransitionHandler
 
 
+# Action types that only the Reflecting API emits
+REFLECTION_CONTROL_TYPES = frozenset({'complete_reflection', 'mark_step_complete', 'mark_stage_complete'})
+
+
 class CompleteBehaviorHandler(BaseTransitionHandler):
     """
     Handles COMPLETE_BEHAVIOR event.
@@ -55,7 +61,7 @@ class CompleteBehaviorHandler(BaseTransitionHandler):
         for action in actions:
             if isinstance(action, dict):
                 action_type = action.get('type', '')
-                if action_type in ('complete_reflection', 'mark_step_complete', 'mark_stage_complete'):
+                if action_type in REFLECTION_CONTROL_TYPES:
                     # This is a reflecting API response, not generating API
                     return False
 
@@ -104,8 +110,9 @@ class CompleteBehaviorHandler(BaseTransitionHandler):
         Args:
             actions: List of action dictionaries to execute
         """
-        from models.action import ExecutionStep, ActionMetadata
-        import uuid
+        # Bound once; the loop below runs for every action in the behavior
+        exec_action = self.script_store.exec_action
+        reserved_keys = {'type', 'content', 'store_id', 'metadata'}
 
         for i, action_dict in enumerate(actions):
             if not isinstance(action_dict, dict):
@@ -115,23 +122,22 @@ class CompleteBehaviorHandler(BaseTransitionHandler):
             action_type = action_dict.get('type', 'unknown')
             content = action_dict.get('content', '')
 
-            self.info(f"Executing action {i+1}/{len(actions)}: {action_type}")
+            self.info("Executing action %d/%d: %s", i + 1, len(actions), action_type)
 
             try:
                 # Create ExecutionStep from action dict
                 step = ExecutionStep(
                     action=action_type,
                     content=content,
-                    store_id=action_dict.get('store_id') or str(uuid.uuid4()),
+                    store_id=action_dict.get('store_id') or str(uuid4()),
                     metadata=action_dict.get('metadata') or ActionMetadata(),
                     # Pass through any other fields from action_dict
-                    **{k: v for k, v in action_dict.items()
-                       if k not in ['type', 'content', 'store_id', 'metadata']}
+                    **{k: v for k, v in action_dict.items() if k not in reserved_keys}
                 )
 
                 # Execute the action
-                self.script_store.exec_action(step)
-                self.info(f"Action {i+1} executed successfully: {action_type}")
+                exec_action(step)
+                self.info("Action %d executed successfully: %s", i + 1, action_type)
 
             except Exception as e:
                 self.error(f"Failed to execute action {i+1} ({action_type}): {e}", exc_info=True)
@@ -8,6 +8,7 @@ replacing the old state_updater.apply_transition() method.
 
 from typing import Dict, Any, List
 from silantui import ModernLogger
+from core.state_classes.state_factory import StateFactory
 
 from .base_transition_handler import BaseTransitionHandler
 from .START_WORKFLOW_handler import StartWorkflowHandler
@@ -21,6 +22,15 @@ from .COMPLETE_STAGE_handler import CompleteStageHandler
 from .NEXT_STAGE_handler import NextStageHandler
 
 
+# States whose next transition is decided locally, without an API response.
+# BEHAVIOR_COMPLETED requires Reflecting API response, not auto-trigger
+AUTO_TRIGGER_ALLOWED_STATES = frozenset({
+    'STEP_COMPLETED',
+    'STAGE_COMPLETED',
+    'ACTION_COMPLETED',  # May need auto-trigger in future
+})
+
+
 class TransitionCoordinator(ModernLogger):
     """
     Coordinates FSM state transitions.
@@ -94,7 +104,7 @@ class TransitionCoordinator(ModernLogger):
         Raises:
             ValueError: If no handler can process the response
         """
-        self.info(f"[Coordinator] Applying transition (api_type={api_type}, auto_trigger={auto_trigger})")
+        self.info("[Coordinator] Applying transition (api_type=%s, auto_trigger=%s)", api_type, auto_trigger)
 
         # Find handler that can process this response
         handler = self._find_handler(api_response)
@@ -110,7 +120,7 @@ class TransitionCoordinator(ModernLogger):
 
         # Get transition name from handler
         transition_name = handler.transition_name
-        self.info(f"[Coordinator] Selected handler: {handler.__class__.__name__} (transition={transition_name})")
+        self.info("[Coordinator] Selected handler: %s (transition=%s)", handler.__class__.__name__, transition_name)
 
         # Apply transition and log it
         updated_state = handler.apply_and_log(
@@ -119,7 +129,7 @@ class TransitionCoordinator(ModernLogger):
             api_type=api_type
         )
 
-        self.info(f"[Coordinator] Transition applied successfully: {transition_name}")
+        self.info("[Coordinator] Transition applied successfully: %s", transition_name)
 
         # Auto-trigger next transition if enabled
         if auto_trigger:
@@ -217,8 +227,6 @@ class TransitionCoordinator(ModernLogger):
         Returns:
             Updated state JSON (may be modified by auto-triggered transition)
         """
-        from core.state_classes.state_factory import StateFactory
-
         # Get current FSM state
         fsm_data = state.get('state', {}).get('FSM', {})
         current_state_name = fsm_data.get('state')
@@ -227,15 +235,8 @@ class TransitionCoordinator(ModernLogger):
             return state
 
         # Only auto-trigger for specific states
-        # BEHAVIOR_COMPLETED requires Reflecting API response, not auto-trigger
-        AUTO_TRIGGER_ALLOWED_STATES = [
-            'STEP_COMPLETED',
-            'STAGE_COMPLETED',
-            'ACTION_COMPLETED',  # May need auto-trigger in future
-        ]
-
         if current_state_name not in AUTO_TRIGGER_ALLOWED_STATES:
-            self.info(f"[Auto-Trigger] Skipping auto-trigger for {current_state_name} (requires API response)")
+            self.info("[Auto-Trigger] Skipping auto-trigger for %s (requires API response)", current_state_name)
             return state
 
         # Get state class instance
@@ -248,7 +249,7 @@ class TransitionCoordinator(ModernLogger):
         if not next_event:
             return state
 
-        self.info(f"[Auto-Trigger] Triggering {next_event.value} from {current_state_name}")
+        self.info("[Auto-Trigger] Triggering %s from %s", next_event.value, current_state_name)
 
         # Create auto-trigger API response
         auto_response = {
@@ -260,7 +261,7 @@ class TransitionCoordinator(ModernLogger):
         # Apply the auto-triggered transition (without recursion)
         try:
             state, _ = self.apply_transition(state, auto_response, auto_trigger=False)
-            self.info(f"[Auto-Trigger] Successfully triggered {next_event.value}")
+            self.info("[Auto-Trigger] Successfully triggered %s", next_event.value)
         except ValueError as e:
             self.warning(f"[Auto-Trigger] Failed to trigger {next_event.value}: {e}")
 
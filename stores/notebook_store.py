@@ -3,6 +3,7 @@ Notebook Store
 Manages notebook cells and their lifecycle.
 """
 
+from collections import Counter
 from silantui import ModernLogger
 from typing import List, Optional, Dict, Any
 from models.cell import Cell, CellType, CellOutput
@@ -17,6 +18,7 @@ class NotebookStore(ModernLogger):
     def __init__(self):
         super().__init__("NotebookStore")
         self.cells: List[Cell] = []
+        self._type_counts: Counter = Counter()  # CellType -> number of cells
         self.title: str = "Untitled Notebook"
         self.execution_count: int = 0
         self.notebook_id: Optional[str] = None  # Explicitly initialize notebook_id
@@ -65,6 +67,7 @@ class NotebookStore(ModernLogger):
         )
 
         self.cells.append(cell)
+        self._type_counts[cell_type] += 1
 
         # Create snapshot for the newly added cell
         self._create_snapshot(cell)
@@ -110,6 +113,7 @@ class NotebookStore(ModernLogger):
         for i, cell in enumerate(self.cells):
             if cell.id == cell_id:
                 self.cells.pop(i)
+                self._type_counts[cell.type] -= 1
                 self.info(f"[NotebookStore] Deleted cell: {cell_id}")
                 return True
         return False
@@ -117,6 +121,7 @@ class NotebookStore(ModernLogger):
     def clear_cells(self):
         """Clear all cells."""
         self.cells = []
+        self._type_counts.clear()
         self.info("[NotebookStore] Cleared all cells")
 
     # ==============================================
@@ -176,6 +181,10 @@ class NotebookStore(ModernLogger):
         """Get all cells of a specific type."""
         return [cell for cell in self.cells if cell.type == cell_type]
 
+    def get_type_counts(self) -> Dict[CellType, int]:
+        """Get the number of cells of each type present in the notebook."""
+        return {cell_type: count for cell_type, count in self._type_counts.items() if count}
+
     def get_cells_by_phase(self, phase_id: str) -> List[Cell]:
         """Get all cells associated with a phase/step."""
         return [cell for cell in self.cells if cell.phase_id == phase_id]
@@ -278,4 +287,5 @@ class NotebookStore(ModernLogger):
         self.execution_count = data.get('execution_count', 0)
         self.notebook_id = data.get('notebook_id')  # Load notebook_id if present
         self.cells = [Cell.from_dict(cell_data) for cell_data in data.get('cells', [])]
+        self._type_counts = Counter(cell.type for cell in self.cells)
         self.info(f"[NotebookStore] Loaded {len(self.cells)} cells from dict, notebook_id={self.notebook_id}")
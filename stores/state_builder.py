@@ -75,12 +75,17 @@ class StateBuilder(ModernLogger):
         """
         effects_list = []
 
+        # Bound once; the loop below runs for every output of every code cell
+        append = effects_list.append
+        convert = self._convert_output_to_effect
+
         for cell in notebook_store.cells:
             if cell.type == CellType.CODE and cell.outputs:
+                cell_ref = cell.id if include_cell_ref else None
                 for output in cell.outputs:
-                    effect = self._convert_output_to_effect(output, cell.id if include_cell_ref else None)
+                    effect = convert(output, cell_ref)
                     if effect:
-                        effects_list.append(effect)
+                        append(effect)
 
         return effects_list
 
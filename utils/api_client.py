@@ -5,6 +5,7 @@ Replicates the TypeScript WorkflowAPIClient.
 """
 
 import json
+import logging
 from silantui import ModernLogger
 import aiohttp
 import asyncio
@@ -12,6 +13,19 @@ from typing import Dict, Any, List, AsyncIterator, Optional
 from .context_compressor import ContextCompressor
 from config import Config
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        """Serialize a request body with orjson (aiohttp expects a str)."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. ints wider than 64 bits, which the stdlib encoder accepts
+            return json.dumps(obj)
+except ImportError:
+    _json_dumps = json.dumps
+
 
 
 class WorkflowAPIClient(ModernLogger):
@@ -32,7 +46,8 @@ class WorkflowAPIClient(ModernLogger):
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # Request bodies carry the full state; serialize them with orjson when available
+            self.session = aiohttp.ClientSession(json_serialize=_json_dumps)
         return self.session
 
 
@@ -112,7 +127,8 @@ class WorkflowAPIClient(ModernLogger):
                 payload['notebook_id'] = notebook_id
 
             self.info(f"[API] Sending reflection for stage={stage_id}, step={step_index}, stream={stream}")
-            self.debug(f"[API] Payload size: {len(json.dumps(payload))} chars")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.debug("[API] Payload size: %d chars", len(_json_dumps(payload)))
 
             # Send request and capture response
             session = await self._get_session()
@@ -263,7 +279,8 @@ class WorkflowAPIClient(ModernLogger):
             # Note: stage_id and step_index are only for logging/tracking
             # The actual state is sent via the 'observation' and 'state' fields in payload
             self.info(f"[API] Sending feedback (context: stage={stage_id}, step={step_index})")
-            self.debug(f"[API] Payload size: {len(json.dumps(payload))} chars")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.debug("[API] Payload size: %d chars", len(_json_dumps(payload)))
 
             # Send request and capture response
             session = await self._get_session()
@@ -11,7 +11,7 @@ Response Handling:
 """
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from silantui import ModernLogger
 from core.transition_handlers import get_transition_coordinator
 from .xml_parser import planning_xml_parser
@@ -60,7 +60,7 @@ class StateUpdater(ModernLogger):
     def apply_transition(
         self,
         state: Dict[str, Any],
-        transition_response: str,
+        transition_response: Union[str, Dict[str, Any]],
         transition_type: str = 'auto'
     ) -> tuple[Dict[str, Any], str]:
         """
@@ -71,6 +71,8 @@ class StateUpdater(ModernLogger):
             transition_response: Transition response
                 - Planning API: XML string (stages/steps/behaviors)
                 - Generating/Reflecting: JSON string or dict (from action stream)
+                Pass already-parsed responses as a dict; they are used as-is,
+                so there is no need to serialize them first.
             transition_type: Type of transition ('planning', 'generating', 'reflecting', 'auto')
 
         Returns:
@@ -83,7 +85,7 @@ class StateUpdater(ModernLogger):
         if isinstance(transition_response, dict):
             # Already a dict, use directly
             api_response = transition_response
-            self.info(f"[StateUpdater] Using dict response directly")
+            self.info("[StateUpdater] Using dict response directly")
 
         elif isinstance(transition_response, str):
             # String response - could be XML (planning) or JSON (generating/reflecting)